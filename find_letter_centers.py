@@ -14,6 +14,7 @@ import argparse
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from letter_center_finder import pipeline
+from letter_center_finder import visualizer
 
 
 def parse_args():
@@ -58,6 +59,44 @@ Examples:
 		help='SVG render zoom factor for rsvg-convert (default: 10)'
 	)
 
+	parser.add_argument(
+		'-j', '--jobs',
+		dest='jobs',
+		type=int,
+		default=1,
+		help='Worker processes for directory input, 0 for one per CPU core (default: 1)'
+	)
+
+	parser.add_argument(
+		'-d', '--diagnostics',
+		dest='diagnostics',
+		action='store_true',
+		help='Write diagnostic PNG and SVG images (default)'
+	)
+	parser.add_argument(
+		'-D', '--no-diagnostics',
+		dest='diagnostics',
+		action='store_false',
+		help='Skip diagnostic images; write only results and summaries'
+	)
+	parser.set_defaults(diagnostics=True)
+
+	parser.add_argument(
+		'-b', '--diagnostic-backend',
+		dest='diagnostic_backend',
+		choices=visualizer.DIAGNOSTIC_BACKENDS,
+		default='matplotlib',
+		help='Diagnostic PNG backend; fast draws panels with OpenCV (default: matplotlib)'
+	)
+
+	parser.add_argument(
+		'-e', '--diagnostic-every',
+		dest='diagnostic_every',
+		type=int,
+		default=1,
+		help='Write a diagnostic PNG for every Nth character of each file (default: 1)'
+	)
+
 	parser.add_argument(
 		'-v', '--verbose',
 		dest='verbose',
@@ -65,7 +104,10 @@ Examples:
 		help='Verbose output'
 	)
 
-	return parser.parse_args()
+	args = parser.parse_args()
+	if args.diagnostic_every < 1:
+		parser.error('--diagnostic-every must be at least 1')
+	return args
 
 
 def main():
@@ -91,7 +133,10 @@ def main():
 			args.output_dir,
 			args.letters,
 			args.zoom,
-			args.verbose
+			args.verbose,
+			args.diagnostics,
+			args.diagnostic_backend,
+			args.diagnostic_every
 		)
 
 		if 'error' in result:
@@ -114,7 +159,11 @@ def main():
 			args.output_dir,
 			args.letters,
 			args.zoom,
-			args.verbose
+			args.verbose,
+			args.jobs,
+			args.diagnostics,
+			args.diagnostic_backend,
+			args.diagnostic_every
 		)
 
 		if 'error' in stats:
@@ -2,10 +2,12 @@
 Compute convex hull and fit axis-aligned ellipses.
 
 Uses direct least-squares fitting for axis-aligned ellipses and
-scipy.spatial.ConvexHull for hull computation.
+OpenCV's 2D convex hull, with scipy.spatial.ConvexHull as a fallback
+for degenerate inputs.
 """
 
 import numpy
+import cv2
 import scipy.spatial
 
 
@@ -26,33 +28,95 @@ def compute_convex_hull(points: numpy.ndarray) -> dict:
 	if len(points) < 3:
 		raise ValueError("Need at least 3 points to compute convex hull")
 
-	hull = scipy.spatial.ConvexHull(points)
+	# OpenCV's planar hull (Sklansky) is much lighter than general-dimension qhull
+	# cv2 accepts int32 and float32 Nx2 directly; contour points from
+	# findContours are already contiguous int32, so skip the copy for them
+	if points.dtype in (numpy.int32, numpy.float32) and points.flags['C_CONTIGUOUS']:
+		cv_points = points
+	else:
+		cv_points = points.astype(numpy.float32)
+	hull_indices = cv2.convexHull(cv_points, returnPoints=False).ravel()
+	if len(hull_indices) < 3:
+		# Degenerate input (e.g. collinear points), let qhull decide
+		return _qhull_convex_hull(points)
 
 	# Extract hull vertices in order
-	hull_vertices = points[hull.vertices]
-
-	# Compute perimeter by summing edge lengths
-	perimeter = 0.0
-	n_verts = len(hull_vertices)
-	for i in range(n_verts):
-		p1 = hull_vertices[i]
-		p2 = hull_vertices[(i + 1) % n_verts]
-		perimeter += numpy.linalg.norm(p2 - p1)
+	hull_vertices = points[hull_indices]
+	area, perimeter = _polygon_area_perimeter(hull_vertices)
 
 	return {
 		'vertices': hull_vertices,
-		'area': float(hull.volume),  # In 2D, volume attribute gives area
+		'area': area,
 		'perimeter': float(perimeter),
 	}
 
 
+#============================================
+def _qhull_convex_hull(points: numpy.ndarray) -> dict:
+	"""
+	Compute convex hull with scipy.spatial.ConvexHull.
+
+	Fallback for inputs where the OpenCV hull has fewer than 3 vertices.
+	qhull raises an error for truly degenerate point sets.
+
+	Args:
+		points: Nx2 array of (x, y) coordinates
+
+	Returns:
+		Hull dict (same format as compute_convex_hull)
+	"""
+	# qhull works on contiguous float64; convert once up front, and
+	# Pp skips the precision-warning reporting pass
+	qhull_points = numpy.ascontiguousarray(points, dtype=numpy.float64)
+	hull = scipy.spatial.ConvexHull(qhull_points, qhull_options='Pp')
+	hull_vertices = points[hull.vertices]
+	area, perimeter = _polygon_area_perimeter(hull_vertices)
+	return {
+		'vertices': hull_vertices,
+		'area': area,
+		'perimeter': perimeter,
+	}
+
+
+#============================================
+def _polygon_area_perimeter(vertices: numpy.ndarray) -> tuple:
+	"""
+	Area and perimeter of a closed polygon in one vectorized pass.
+
+	Both metrics share the same rolled (next-vertex) array.
+
+	Args:
+		vertices: Mx2 array of polygon vertices in order
+
+	Returns:
+		Tuple (area, perimeter) as floats
+	"""
+	vertices = vertices.astype(float)
+	# each row of next_verts is the following vertex (wrapping)
+	next_verts = numpy.roll(vertices, -1, axis=0)
+	x = vertices[:, 0]
+	y = vertices[:, 1]
+	# Shoelace formula: 0.5 * |sum(x_i * y_{i+1} - x_{i+1} * y_i)|
+	cross = numpy.dot(x, next_verts[:, 1]) - numpy.dot(y, next_verts[:, 0])
+	area = 0.5 * abs(float(cross))
+	# Edge lengths via hypot in a single ufunc call over all edges
+	edges = next_verts - vertices
+	perimeter = float(numpy.hypot(edges[:, 0], edges[:, 1]).sum())
+	return (area, perimeter)
+
+
 #============================================
 def fit_axis_aligned_ellipse(points: numpy.ndarray) -> dict:
 	"""
 	Fit an axis-aligned ellipse using direct least-squares.
 
-	Fits the conic equation: a*x^2 + b*y^2 + c*x + d*y + 1 = 0
-	via ordinary least squares.
+	Fits the conic equation: a*x^2 + b*y^2 + d*x + e*y + f = 0
+	with the Halir-Flusser numerically stable direct ellipse fit,
+	specialized to the axis-aligned case (no xy term). The ellipse
+	constraint 4*a*b = 1 is enforced through a reduced 2x2 eigenproblem.
+	Points are centered on their mean and scaled to unit RMS radius
+	before fitting so the x^2, x, and constant columns have comparable
+	magnitude and the scatter matrices stay well conditioned.
 
 	The ellipse has no rotation (axis-aligned), with semi_x as the
 	horizontal semi-axis and semi_y as the vertical semi-axis.
@@ -76,30 +140,64 @@ def fit_axis_aligned_ellipse(points: numpy.ndarray) -> dict:
 	x = points[:, 0].astype(float)
 	y = points[:, 1].astype(float)
 
-	# Build design matrix for: a*x^2 + b*y^2 + c*x + d*y = -1
-	design = numpy.column_stack([x**2, y**2, x, y])
-	rhs = -numpy.ones(len(x))
-
-	# Solve via least squares
-	result, _, _, _ = numpy.linalg.lstsq(design, rhs, rcond=None)
-	a_coeff, b_coeff, c_coeff, d_coeff = result
+	# Center the points so pixel offsets do not blow up the x^2, y^2 columns
+	x_mean = float(x.mean())
+	y_mean = float(y.mean())
+	x = x - x_mean
+	y = y - y_mean
 
-	# Validate: for a valid ellipse, a and b must be positive
-	if a_coeff <= 0 or b_coeff <= 0:
+	# Scale to unit RMS radius so quadratic and linear columns balance
+	coord_scale = float(numpy.sqrt(numpy.mean(x * x + y * y)))
+	if coord_scale == 0:
 		return _fallback_ellipse_fit(points)
+	x = x / coord_scale
+	y = y / coord_scale
+
+	# Split the design matrix into quadratic [x^2, y^2] and linear [x, y, 1] parts
+	design_quad = numpy.column_stack([x * x, y * y])
+	design_lin = numpy.column_stack([x, y, numpy.ones(len(x))])
+
+	# Scatter matrices of the split design
+	scatter_1 = design_quad.T @ design_quad
+	scatter_2 = design_quad.T @ design_lin
+	scatter_3 = design_lin.T @ design_lin
+
+	# Linear coefficients as a function of the quadratic ones: lin = t_mat @ quad
+	# lstsq tolerates a singular scatter_3 (e.g. collinear points)
+	t_mat = -numpy.linalg.lstsq(scatter_3, scatter_2.T, rcond=None)[0]
+	reduced = scatter_1 + scatter_2 @ t_mat
+
+	# Constraint matrix for 4*a*b = 1 is [[0, 2], [2, 0]]; its inverse swaps rows
+	# and halves them, giving the reduced eigenproblem matrix
+	m_mat = 0.5 * numpy.array([reduced[1], reduced[0]])
+	_, eigvecs = numpy.linalg.eig(m_mat)
+	eigvecs = numpy.real(eigvecs)
+
+	# Pick the eigenvector that satisfies the ellipse constraint a*b > 0
+	constraint = eigvecs[0] * eigvecs[1]
+	if not numpy.any(constraint > 0):
+		return _fallback_ellipse_fit(points)
+	quad = eigvecs[:, int(numpy.argmax(constraint))]
+	# Eigenvector sign is arbitrary, normalize so a and b are positive
+	if quad[0] < 0:
+		quad = -quad
+	lin = t_mat @ quad
+	a_coeff, b_coeff = quad
+	d_coeff, e_coeff, f_coeff = lin
 
-	# Extract center: cx = -c/(2a), cy = -d/(2b)
-	cx = -c_coeff / (2.0 * a_coeff)
-	cy = -d_coeff / (2.0 * b_coeff)
+	# Extract center: cx = -d/(2a), cy = -e/(2b), undoing scale and centering
+	cx = -d_coeff / (2.0 * a_coeff) * coord_scale + x_mean
+	cy = -e_coeff / (2.0 * b_coeff) * coord_scale + y_mean
 
-	# Semi-axes: R = c^2/(4a) + d^2/(4b) - 1
-	r_val = c_coeff**2 / (4.0 * a_coeff) + d_coeff**2 / (4.0 * b_coeff) - 1.0
+	# Semi-axes: R = d^2/(4a) + e^2/(4b) - f
+	r_val = d_coeff**2 / (4.0 * a_coeff) + e_coeff**2 / (4.0 * b_coeff) - f_coeff
 
 	if r_val <= 0:
 		return _fallback_ellipse_fit(points)
 
-	semi_x = numpy.sqrt(r_val / a_coeff)
-	semi_y = numpy.sqrt(r_val / b_coeff)
+	# Semi-axes scale linearly with the coordinates
+	semi_x = numpy.sqrt(r_val / a_coeff) * coord_scale
+	semi_y = numpy.sqrt(r_val / b_coeff) * coord_scale
 
 	# Determine major/minor (major should be the larger one)
 	major_axis = max(semi_x, semi_y)
@@ -199,6 +297,64 @@ def _point_to_ellipse_distance(px: float, py: float, cx: float, cy: float,
 	return abs(r_point - r_ellipse)
 
 
+#============================================
+def _points_to_ellipse_distances(points: numpy.ndarray, cx: float, cy: float,
+	semi_x: float, semi_y: float) -> numpy.ndarray:
+	"""
+	Vectorized version of _point_to_ellipse_distance over a point array.
+
+	Args:
+		points: Nx2 array of (x, y) coordinates
+		cx, cy: Ellipse center
+		semi_x, semi_y: Horizontal and vertical semi-axes
+
+	Returns:
+		Length N array of approximate distances in pixels
+	"""
+	# Offsets from the ellipse center
+	off_x = points[:, 0] - cx
+	off_y = points[:, 1] - cy
+	distances = _offsets_to_ellipse_distances(off_x, off_y, semi_x, semi_y)
+	return distances
+
+
+#============================================
+def _offsets_to_ellipse_distances(off_x: numpy.ndarray, off_y: numpy.ndarray,
+	semi_x: float, semi_y: float) -> numpy.ndarray:
+	"""
+	Boundary distances for point offsets already taken from the ellipse center.
+
+	Args:
+		off_x: Length N contiguous array of x offsets from the center
+		off_y: Length N contiguous array of y offsets from the center
+		semi_x, semi_y: Horizontal and vertical semi-axes
+
+	Returns:
+		Length N array of approximate distances in pixels
+	"""
+	# Normalize to unit circle space
+	dx = off_x / semi_x
+	dy = off_y / semi_y
+	# The scalar version uses theta = arctan2(b, a) with a = dx*semi_y and
+	# b = dy*semi_x, then cos(theta) = a/h and sin(theta) = b/h with
+	# h = hypot(a, b); substituting removes all trig calls and temporaries
+	a_comp = dx * semi_y
+	b_comp = dy * semi_x
+	h_comp = numpy.hypot(a_comp, b_comp)
+	at_center = h_comp == 0
+	# Radius of the ellipse along each point's angle
+	with numpy.errstate(divide='ignore', invalid='ignore'):
+		r_ellipse = (semi_x * semi_y) * h_comp / numpy.hypot(
+			semi_y * a_comp, semi_x * b_comp
+		)
+	# Point radius at each angle
+	r_point = numpy.hypot(off_x, off_y)
+	distances = numpy.abs(r_point - r_ellipse)
+	# Points exactly at the center are a minor semi-axis away from the boundary
+	distances = numpy.where(at_center, min(semi_x, semi_y), distances)
+	return distances
+
+
 #============================================
 def compute_fit_quality(points: numpy.ndarray, ellipse: dict) -> dict:
 	"""
@@ -228,23 +384,26 @@ def compute_fit_quality(points: numpy.ndarray, ellipse: dict) -> dict:
 	if avg_radius == 0:
 		return _degenerate_quality()
 
+	# Offsets from the ellipse center as contiguous float columns, built
+	# once and shared by every metric below instead of re-slicing the
+	# strided Nx2 array
+	off_x = numpy.ascontiguousarray(points[:, 0], dtype=float) - cx
+	off_y = numpy.ascontiguousarray(points[:, 1], dtype=float) - cy
+
 	# Center offset: distance from ellipse center to centroid of points
-	centroid_x = float(numpy.mean(points[:, 0]))
-	centroid_y = float(numpy.mean(points[:, 1]))
-	center_offset = numpy.sqrt((cx - centroid_x)**2 + (cy - centroid_y)**2)
+	mean_off_x = float(numpy.mean(off_x))
+	mean_off_y = float(numpy.mean(off_y))
+	center_offset = numpy.sqrt(mean_off_x**2 + mean_off_y**2)
 
 	# Boundary distance for each point
-	distances = numpy.array([
-		_point_to_ellipse_distance(p[0], p[1], cx, cy, semi_x, semi_y)
-		for p in points
-	])
+	distances = _offsets_to_ellipse_distances(off_x, off_y, semi_x, semi_y)
 
 	mean_dist = float(numpy.mean(distances))
 	max_dist = float(numpy.max(distances))
 
 	# Coverage: fraction of points inside the ellipse (algebraic test)
-	x_norm = (points[:, 0] - cx) / semi_x
-	y_norm = (points[:, 1] - cy) / semi_y
+	x_norm = off_x / semi_x
+	y_norm = off_y / semi_y
 	ellipse_vals = x_norm**2 + y_norm**2
 	# Points on or inside the ellipse have value <= 1.0
 	# Allow small tolerance for points very close to boundary
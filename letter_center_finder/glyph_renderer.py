@@ -6,9 +6,7 @@ is visible (everything else is white). Renders via rsvg-convert for accurate
 font and position fidelity. Extracts binary mask and contour from the render.
 """
 
-import os
 import copy
-import tempfile
 import subprocess
 
 import numpy
@@ -18,6 +16,11 @@ import xml.etree.ElementTree as ET
 # SVG namespace used in target files
 SVG_NS = "http://www.w3.org/2000/svg"
 WHITE = "#ffffff"
+# Clark-qualified tags built once at import
+_SVG_TAG = f'{{{SVG_NS}}}svg'
+_RECT_TAG = f'{{{SVG_NS}}}rect'
+_TEXT_TAG = f'{{{SVG_NS}}}text'
+_TSPAN_TAG = f'{{{SVG_NS}}}tspan'
 
 # Style attributes that must propagate to all tspan fragments
 _STYLE_ATTRS = ('font-size', 'font-weight', 'font-family', 'font-style')
@@ -26,7 +29,42 @@ _POS_ATTRS = ('dx', 'dy')
 
 
 #============================================
-def render_isolated_glyph(svg_path: str, char_meta: dict, zoom: int = 10) -> numpy.ndarray:
+def load_svg_context(svg_path: str, svg_bytes: bytes = None) -> dict:
+	"""
+	Parse an SVG once for rendering many of its characters.
+
+	Args:
+		svg_path: Path to original SVG file
+		svg_bytes: Optional contents of svg_path already in memory; the
+			file is read when not given
+
+	Returns:
+		Dict with:
+		- svg_bytes: raw file contents, for later writers of the same file
+		- root: parsed SVG root element (treated as read-only)
+		- text_elements: all <text> elements in document order
+		- isolation_header: serialized isolation SVG opening (root element
+			and white background), shared by every character of the file
+	"""
+	# Read the file once; the bytes are parsed here and reused by the
+	# diagnostic overlay writer
+	if svg_bytes is None:
+		with open(svg_path, 'rb') as svg_file:
+			svg_bytes = svg_file.read()
+	root = ET.fromstring(svg_bytes)  # nosec B314 - local SVG files only
+	svg_context = {
+		'svg_bytes': svg_bytes,
+		'root': root,
+		# Same document order as svg_parser, so _text_elem_index lines up
+		'text_elements': list(root.iter(_TEXT_TAG)),
+		'isolation_header': _build_isolation_header(root),
+	}
+	return svg_context
+
+
+#============================================
+def render_isolated_glyph(svg_path: str, char_meta: dict, zoom: int = 10,
+	svg_context: dict = None) -> numpy.ndarray:
 	"""
 	Render a single character from the SVG in isolation.
 
@@ -38,12 +76,17 @@ def render_isolated_glyph(svg_path: str, char_meta: dict, zoom: int = 10) -> num
 		char_meta: Character metadata dict from svg_parser (must include
 			_text_elem_index, _tspan_index, _char_offset, fill_color)
 		zoom: Render zoom factor (default 10 for high resolution)
+		svg_context: Optional pre-parsed context from load_svg_context(),
+			reused across characters of the same file to skip re-parsing
 
 	Returns:
 		Grayscale numpy array (uint8) of the rendered image
 	"""
+	if svg_context is None:
+		svg_context = load_svg_context(svg_path)
+
 	# Build the isolation SVG content
-	isolation_svg = _build_isolation_svg(svg_path, char_meta)
+	isolation_svg = _build_isolation_svg(svg_context, char_meta)
 
 	# Render to PNG via rsvg-convert
 	image = _render_svg_string(isolation_svg, zoom)
@@ -52,29 +95,26 @@ def render_isolated_glyph(svg_path: str, char_meta: dict, zoom: int = 10) -> num
 
 
 #============================================
-def _build_isolation_svg(svg_path: str, char_meta: dict) -> str:
+def _build_isolation_header(root) -> str:
 	"""
-	Build an SVG string where only the target character is visible.
+	Serialize the opening of an isolation SVG for one source file.
 
-	All paths, polygons, lines are removed. All text elements are removed
-	except the one containing the target character, which is restructured
-	so only the target character has its original fill color.
+	The header holds a new SVG root with the source dimensions and a white
+	background rect covering the viewBox. It does not depend on the target
+	character, so it is built once per file and the closing </svg> tag is
+	left off for the per-character text element.
 
 	Args:
-		svg_path: Path to original SVG
-		char_meta: Character metadata with element identification fields
+		root: Parsed root element of the original SVG
 
 	Returns:
-		SVG content as a string
+		XML declaration, <svg> start tag and background rect as a string
 	"""
-	tree = ET.parse(svg_path)  # nosec B314 - local SVG files only
-	root = tree.getroot()
-
 	# Register default namespace so output has clean tags
 	ET.register_namespace('', SVG_NS)
 
 	# Create new SVG root with same dimensions
-	new_root = ET.Element(f'{{{SVG_NS}}}svg')
+	new_root = ET.Element(_SVG_TAG)
 	new_root.set('version', '1.1')
 	for attr in ('width', 'height', 'viewBox', 'preserveAspectRatio'):
 		val = root.get(attr)
@@ -93,27 +133,50 @@ def _build_isolation_svg(svg_path: str, char_meta: dict) -> str:
 		vb_h = float(root.get('height', '300').replace('px', ''))
 
 	# Background rect with generous padding
-	bg = ET.SubElement(new_root, f'{{{SVG_NS}}}rect')
+	bg = ET.SubElement(new_root, _RECT_TAG)
 	bg.set('x', str(vb_x - 50))
 	bg.set('y', str(vb_y - 50))
 	bg.set('width', str(vb_w + 100))
 	bg.set('height', str(vb_h + 100))
 	bg.set('fill', WHITE)
 
+	# Serialize and drop the closing tag so the text element can follow
+	svg_string = ET.tostring(new_root, encoding='unicode', xml_declaration=True)
+	header = svg_string[:svg_string.rindex('</svg>')]
+	return header
+
+
+#============================================
+def _build_isolation_svg(svg_context: dict, char_meta: dict) -> str:
+	"""
+	Build an SVG string where only the target character is visible.
+
+	All paths, polygons, lines are removed. All text elements are removed
+	except the one containing the target character, which is restructured
+	so only the target character has its original fill color. Only that
+	text element is copied and serialized per character; the rest of the
+	document comes from the cached isolation header.
+
+	Args:
+		svg_context: Parsed SVG context from load_svg_context()
+		char_meta: Character metadata with element identification fields
+
+	Returns:
+		SVG content as a string
+	"""
 	# Find the target text element in the original SVG
-	text_tag = f'{{{SVG_NS}}}text'
-	text_elements = root.findall(f'.//{text_tag}')
 	text_idx = char_meta['_text_elem_index']
-	target_text = text_elements[text_idx]
+	target_text = svg_context['text_elements'][text_idx]
 
-	# Deep copy and modify the text element
+	# Deep copy only this small subtree, the shared tree stays untouched
 	text_copy = copy.deepcopy(target_text)
 	_isolate_character(text_copy, char_meta)
-
-	new_root.append(text_copy)
+	# Drop the tail so source whitespace does not follow the element
+	text_copy.tail = None
 
 	# Write to string
-	svg_string = ET.tostring(new_root, encoding='unicode', xml_declaration=True)
+	text_string = ET.tostring(text_copy, encoding='unicode')
+	svg_string = svg_context['isolation_header'] + text_string + '</svg>'
 	return svg_string
 
 
@@ -133,12 +196,11 @@ def _isolate_character(text_elem, char_meta: dict) -> None:
 	char_offset = char_meta['_char_offset']
 	original_fill = char_meta['fill_color']
 
-	tspan_tag = f'{{{SVG_NS}}}tspan'
-	tspan_children = [child for child in text_elem if child.tag == tspan_tag]
+	tspan_children = [child for child in text_elem if child.tag == _TSPAN_TAG]
 
 	if tspan_idx is None:
 		# Target character is in direct text of the text element
-		_isolate_in_direct_text(text_elem, char_offset, original_fill, tspan_tag)
+		_isolate_in_direct_text(text_elem, char_offset, original_fill, _TSPAN_TAG)
 		# White out any tspan children
 		for tspan in tspan_children:
 			tspan.set('fill', WHITE)
@@ -160,7 +222,7 @@ def _isolate_character(text_elem, char_meta: dict) -> None:
 				else:
 					# Multi-char tspan needs splitting
 					_split_tspan_for_isolation(
-						text_elem, tspan, char_offset, original_fill, tspan_tag
+						text_elem, tspan, char_offset, original_fill, _TSPAN_TAG
 					)
 
 
@@ -319,41 +381,30 @@ def _render_svg_string(svg_string: str, zoom: int = 10) -> numpy.ndarray:
 	Returns:
 		Grayscale numpy array (uint8)
 	"""
-	# Write SVG to temp file, render to PNG, read PNG
-	with tempfile.NamedTemporaryFile(suffix='.svg', mode='w', delete=False) as svg_f:
-		svg_f.write(svg_string)
-		svg_tmp = svg_f.name
-
-	png_tmp = svg_tmp.replace('.svg', '.png')
-
-	try:
-		# Render with rsvg-convert
-		cmd = [
-			'rsvg-convert',
-			f'--zoom={zoom}',
-			'-o', png_tmp,
-			svg_tmp,
-		]
-		result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-		if result.returncode != 0:
-			raise RuntimeError(f"rsvg-convert failed: {result.stderr}")
-
-		# Read the PNG as grayscale
-		image = cv2.imread(png_tmp, cv2.IMREAD_GRAYSCALE)
-		if image is None:
-			raise RuntimeError(f"Failed to read rendered PNG: {png_tmp}")
-		return image
-
-	finally:
-		# Clean up temp files
-		if os.path.exists(svg_tmp):
-			os.unlink(svg_tmp)
-		if os.path.exists(png_tmp):
-			os.unlink(png_tmp)
+	# Pipe SVG into rsvg-convert on stdin and read PNG bytes from stdout,
+	# avoiding temp files on disk
+	cmd = [
+		'rsvg-convert',
+		f'--zoom={zoom}',
+	]
+	result = subprocess.run(
+		cmd, input=svg_string.encode('utf-8'), capture_output=True, timeout=30
+	)
+	if result.returncode != 0:
+		stderr_text = result.stderr.decode('utf-8', errors='replace')
+		raise RuntimeError(f"rsvg-convert failed: {stderr_text}")
+
+	# Decode the PNG as grayscale from the in-memory buffer
+	png_bytes = numpy.frombuffer(result.stdout, dtype=numpy.uint8)
+	image = cv2.imdecode(png_bytes, cv2.IMREAD_GRAYSCALE)
+	if image is None:
+		raise RuntimeError("Failed to decode PNG output from rsvg-convert")
+	return image
 
 
 #============================================
-def extract_binary_mask(glyph_image: numpy.ndarray) -> numpy.ndarray:
+def extract_binary_mask(glyph_image: numpy.ndarray,
+	close_gaps: bool = True) -> numpy.ndarray:
 	"""
 	Convert grayscale rendered image to binary mask of the glyph.
 
@@ -362,6 +413,8 @@ def extract_binary_mask(glyph_image: numpy.ndarray) -> numpy.ndarray:
 
 	Args:
 		glyph_image: Grayscale image from render_isolated_glyph()
+		close_gaps: Apply close_mask_gaps() here; pass False when the
+			caller crops first and closes the smaller crop instead
 
 	Returns:
 		Binary image: 255 = glyph pixels, 0 = background
@@ -371,14 +424,44 @@ def extract_binary_mask(glyph_image: numpy.ndarray) -> numpy.ndarray:
 		glyph_image, 0, 255,
 		cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
 	)
-
-	# Morphological closing to fill small anti-aliasing gaps
-	kernel = numpy.ones((3, 3), numpy.uint8)
-	binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+	if not close_gaps:
+		return binary
+
+	# Restrict closing to the glyph bounding box; a 2 px margin of
+	# background (kernel radius + 1) keeps the result identical to
+	# closing the full canvas
+	x, y, w, h = cv2.boundingRect(binary)
+	if w == 0 or h == 0:
+		return binary
+	margin = 2
+	y0 = max(0, y - margin)
+	x0 = max(0, x - margin)
+	y1 = min(binary.shape[0], y + h + margin)
+	x1 = min(binary.shape[1], x + w + margin)
+	binary[y0:y1, x0:x1] = close_mask_gaps(binary[y0:y1, x0:x1])
 
 	return binary
 
 
+#============================================
+def close_mask_gaps(binary_mask: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Morphological closing to fill small anti-aliasing gaps in a glyph mask.
+
+	Results match closing the full canvas as long as the mask keeps at
+	least 2 px of background around the glyph (or reaches the canvas edge).
+
+	Args:
+		binary_mask: Binary image (255 = glyph, 0 = background)
+
+	Returns:
+		Closed binary image of the same shape
+	"""
+	kernel = numpy.ones((3, 3), numpy.uint8)
+	closed = cv2.morphologyEx(binary_mask, cv2.MORPH_CLOSE, kernel)
+	return closed
+
+
 #============================================
 def extract_contour_points(binary_mask: numpy.ndarray) -> numpy.ndarray:
 	"""
@@ -400,8 +483,12 @@ def extract_contour_points(binary_mask: numpy.ndarray) -> numpy.ndarray:
 	if len(contours) == 0:
 		raise ValueError("No contours found in binary mask")
 
-	# Select largest contour (the glyph)
-	largest_contour = max(contours, key=cv2.contourArea)
+	# Select largest contour (the glyph); an isolated glyph usually has
+	# exactly one outer contour, so skip the area ranking in that case
+	if len(contours) == 1:
+		largest_contour = contours[0]
+	else:
+		largest_contour = max(contours, key=cv2.contourArea)
 
 	# Reshape from Nx1x2 to Nx2
 	points = largest_contour.reshape(-1, 2)
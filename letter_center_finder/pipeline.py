@@ -8,14 +8,26 @@ coordinate mapping, and diagnostic visualization.
 import os
 import json
 import glob
+import functools
+import concurrent.futures
 
 import numpy
+import cv2
 
 from . import svg_parser
 from . import glyph_renderer
 from . import geometry
 from . import visualizer
 
+# Threads used to run rsvg-convert renders concurrently within one file;
+# the GIL is released while each subprocess runs
+RENDER_THREADS = 4
+# Threads that encode and write diagnostic PNGs in the background
+WRITE_THREADS = 2
+# Encoded-but-unwritten diagnostics allowed in flight; each holds a full
+# RGBA raster, so the queue is bounded on files with many characters
+MAX_PENDING_WRITES = 8
+
 
 #============================================
 def process_single_character(
@@ -26,6 +38,13 @@ def process_single_character(
 	char_index: int = 0,
 	zoom: int = 10,
 	verbose: bool = False,
+	svg_context: dict = None,
+	glyph_image: numpy.ndarray = None,
+	diagnostics: bool = True,
+	write_pool: dict = None,
+	render_scale: float = None,
+	diagnostic_backend: str = 'matplotlib',
+	diagnostic_figure: dict = None,
 ) -> dict:
 	"""
 	Process one character: isolate, render, fit, visualize.
@@ -38,6 +57,19 @@ def process_single_character(
 		char_index: Index of this character (for output naming)
 		zoom: Render zoom factor
 		verbose: Print progress
+		svg_context: Optional parsed SVG from glyph_renderer.load_svg_context(),
+			shared by all characters of one file
+		glyph_image: Optional pre-rendered isolation image; rendered here
+			when not given
+		diagnostics: Write the per-character diagnostic PNG
+		write_pool: Optional dict with 'executor' (thread pool for background
+			PNG writes) and 'futures' (list collecting the pending writes)
+		render_scale: Pixels per SVG unit from svg_parser.get_render_scale(),
+			computed once per file; derived from svg_dims when not given
+		diagnostic_backend: Diagnostic PNG backend, 'matplotlib' or 'fast'
+		diagnostic_figure: Optional figure from
+			visualizer.create_diagnostic_figure(), reused across the
+			characters of one file by the matplotlib backend
 
 	Returns:
 		Dict with all analysis results including SVG-space ellipse
@@ -49,13 +81,16 @@ def process_single_character(
 			f"(source: {char_meta['source_text'][:30]})")
 
 	# Step 1: Render isolated glyph
-	glyph_image = glyph_renderer.render_isolated_glyph(svg_path, char_meta, zoom)
+	if glyph_image is None:
+		glyph_image = glyph_renderer.render_isolated_glyph(
+			svg_path, char_meta, zoom, svg_context
+		)
 
-	# Step 2: Extract binary mask
-	binary_mask = glyph_renderer.extract_binary_mask(glyph_image)
+	# Step 2: Extract binary mask (gap closing runs on the crop in step 4)
+	binary_mask = glyph_renderer.extract_binary_mask(glyph_image, close_gaps=False)
 
 	# Step 3: Check that we actually found glyph pixels
-	glyph_pixel_count = numpy.count_nonzero(binary_mask)
+	glyph_pixel_count = cv2.countNonZero(binary_mask)
 	if glyph_pixel_count < 10:
 		error_msg = f"Too few glyph pixels ({glyph_pixel_count}), isolation may have failed"
 		if verbose:
@@ -64,6 +99,8 @@ def process_single_character(
 
 	# Step 4: Crop to glyph region for efficiency and better diagnostics
 	glyph_crop, mask_crop, crop_offset = _crop_to_glyph(glyph_image, binary_mask, padding=20)
+	# The 20 px padding keeps crop closing identical to full-canvas closing
+	mask_crop = glyph_renderer.close_mask_gaps(mask_crop)
 
 	# Step 5: Extract contour in cropped coordinates
 	contour_points = glyph_renderer.extract_contour_points(mask_crop)
@@ -90,12 +127,10 @@ def process_single_character(
 	svg_cx, svg_cy = svg_parser.pixel_to_svg(pixel_cx, pixel_cy, svg_dims, zoom)
 
 	# Map semi-axes from pixel to SVG units (use scale factor)
-	vb = svg_dims['viewBox']
-	vp_w = svg_dims['viewport_width'] * zoom
-	scale = min(vp_w / vb['width'],
-		svg_dims['viewport_height'] * zoom / vb['height'])
-	svg_rx = ellipse_result['semi_x'] / scale
-	svg_ry = ellipse_result['semi_y'] / scale
+	if render_scale is None:
+		render_scale = svg_parser.get_render_scale(svg_dims, zoom)
+	svg_rx = ellipse_result['semi_x'] / render_scale
+	svg_ry = ellipse_result['semi_y'] / render_scale
 
 	svg_ellipse = {
 		'cx': float(svg_cx),
@@ -104,17 +139,26 @@ def process_single_character(
 		'ry': float(svg_ry),
 	}
 
-	# Step 10: Generate diagnostic PNG
-	diag_filename = f"{char}_{char_index}_diagnostic.png"
-	diag_path = os.path.join(output_dir, diag_filename)
-	visualizer.create_diagnostic_plot(
-		glyph_crop, mask_crop, contour_points,
-		hull_result['vertices'], ellipse_result, fit_quality,
-		diag_path, char
-	)
+	# Step 10: Generate diagnostic PNG (the slowest step, so optional)
+	diag_filename = None
+	if diagnostics:
+		diag_filename = f"{char}_{char_index}_diagnostic.png"
+		diag_path = os.path.join(output_dir, diag_filename)
+		write_executor = None
+		if write_pool is not None:
+			write_executor = write_pool['executor']
+		write_future = visualizer.create_diagnostic_plot(
+			glyph_crop, mask_crop, contour_points,
+			hull_result['vertices'], ellipse_result, fit_quality,
+			diag_path, char, write_executor, diagnostic_backend,
+			diagnostic_figure
+		)
+		if write_future is not None:
+			write_pool['futures'].append(write_future)
 
 	if verbose:
-		print(f"    + Saved diagnostic: {diag_filename}")
+		if diag_filename:
+			print(f"    + Saved diagnostic: {diag_filename}")
 		print(f"    SVG center: ({svg_cx:.2f}, {svg_cy:.2f})")
 		print(f"    Mean boundary: {fit_quality['mean_boundary_pct']:.1f}%  "
 			f"Coverage: {fit_quality['coverage']:.1%}")
@@ -153,6 +197,21 @@ def process_single_character(
 	return result
 
 
+#============================================
+def _limit_pending_writes(write_pool: dict, max_pending: int) -> None:
+	"""
+	Block on the oldest background PNG writes until few enough remain.
+
+	Args:
+		write_pool: Dict with 'executor' and 'futures' (oldest first)
+		max_pending: Largest number of writes left outstanding
+	"""
+	futures = write_pool['futures']
+	while len(futures) > max_pending:
+		# result() also surfaces any write error right away
+		futures.pop(0).result()
+
+
 #============================================
 def _crop_to_glyph(image: numpy.ndarray, mask: numpy.ndarray,
 	padding: int = 20) -> tuple:
@@ -167,19 +226,16 @@ def _crop_to_glyph(image: numpy.ndarray, mask: numpy.ndarray,
 	Returns:
 		Tuple of (cropped_image, cropped_mask, (x_offset, y_offset))
 	"""
-	# Find bounding box of non-zero pixels in the mask
-	coords = numpy.column_stack(numpy.where(mask > 0))
-	if len(coords) == 0:
+	# Bounding box of non-zero mask pixels in a single C pass
+	x, y, w, h = cv2.boundingRect(mask)
+	if w == 0 or h == 0:
 		return image, mask, (0, 0)
 
-	y_min, x_min = coords.min(axis=0)
-	y_max, x_max = coords.max(axis=0)
-
 	# Add padding, clamped to image bounds
-	y_min = max(0, y_min - padding)
-	x_min = max(0, x_min - padding)
-	y_max = min(image.shape[0], y_max + padding + 1)
-	x_max = min(image.shape[1], x_max + padding + 1)
+	y_min = max(0, y - padding)
+	x_min = max(0, x - padding)
+	y_max = min(image.shape[0], y + h + padding)
+	x_max = min(image.shape[1], x + w + padding)
 
 	cropped_image = image[y_min:y_max, x_min:x_max]
 	cropped_mask = mask[y_min:y_max, x_min:x_max]
@@ -194,6 +250,9 @@ def process_svg_file(
 	target_letters: str = 'OC',
 	zoom: int = 10,
 	verbose: bool = False,
+	diagnostics: bool = True,
+	diagnostic_backend: str = 'matplotlib',
+	diagnostic_every: int = 1,
 ) -> dict:
 	"""
 	Process all O/C characters in one SVG file.
@@ -204,10 +263,21 @@ def process_svg_file(
 		target_letters: Letters to analyze (e.g., 'OC')
 		zoom: Render zoom factor
 		verbose: Print progress
+		diagnostics: Write diagnostic PNGs and the diagnostic SVG overlay
+		diagnostic_backend: Diagnostic PNG backend, 'matplotlib' or 'fast'
+		diagnostic_every: Write a diagnostic PNG for every Nth target
+			character of the file only (1 for all of them)
 
 	Returns:
 		Dict with processing results for all characters
+
+	Raises:
+		ValueError: If diagnostic_every is less than 1
 	"""
+	# The CLI checks this too; library callers would otherwise hit a
+	# ZeroDivisionError in the stride modulo
+	if diagnostic_every < 1:
+		raise ValueError(f"diagnostic_every must be at least 1, got {diagnostic_every}")
 	svg_basename = os.path.splitext(os.path.basename(svg_path))[0]
 
 	if verbose:
@@ -217,12 +287,21 @@ def process_svg_file(
 	svg_output_dir = os.path.join(output_dir, svg_basename)
 	os.makedirs(svg_output_dir, exist_ok=True)
 
-	# Get SVG dimensions for coordinate mapping
-	svg_dims = svg_parser.get_svg_dimensions(svg_path)
-
-	# Parse SVG to find target characters
-	all_chars = svg_parser.parse_svg_file(svg_path)
-	target_chars = [c for c in all_chars if c['character'] in target_letters]
+	# Read the file once; the bytes feed the tree parse and the overlay
+	with open(svg_path, 'rb') as svg_file:
+		svg_bytes = svg_file.read()
+
+	target_chars = []
+	# A file with no O, C or character reference bytes holds no target
+	# letter, so it skips the tree parse and the isolation header
+	if svg_parser.may_contain_targets(svg_bytes):
+		# Parse the SVG once; the same tree feeds dimensions, character
+		# metadata, and all isolation renders of this file
+		svg_context = glyph_renderer.load_svg_context(svg_path, svg_bytes)
+		svg_dims, all_chars = svg_parser.parse_svg_root(svg_context['root'])
+		# The SVG-to-pixel scale depends only on the file and zoom
+		render_scale = svg_parser.get_render_scale(svg_dims, zoom)
+		target_chars = [c for c in all_chars if c['character'] in target_letters]
 
 	if verbose:
 		print(f"  Found {len(target_chars)} target characters ({target_letters})")
@@ -231,16 +310,52 @@ def process_svg_file(
 	results = []
 	char_counts = {}
 
-	for char_meta in target_chars:
-		char = char_meta['character']
-		char_idx = char_counts.get(char, 0)
-		char_counts[char] = char_idx + 1
-
-		result = process_single_character(
-			svg_path, char_meta, svg_dims, svg_output_dir,
-			char_idx, zoom, verbose
+	# Renders run on a thread pool one chunk at a time, which bounds the
+	# number of full-canvas images held in memory; fitting and matplotlib
+	# drawing stay on this thread since pyplot is not thread-safe, while
+	# finished diagnostic PNGs are encoded and written on a second pool;
+	# files without target letters skip the pools and the figure entirely
+	if target_chars:
+		# Bind the per-file arguments so only the character varies per render
+		render_one = functools.partial(
+			glyph_renderer.render_isolated_glyph, svg_path,
+			zoom=zoom, svg_context=svg_context,
 		)
-		results.append(result)
+		render_pool = concurrent.futures.ThreadPoolExecutor(max_workers=RENDER_THREADS)
+		write_executor = concurrent.futures.ThreadPoolExecutor(max_workers=WRITE_THREADS)
+		write_pool = {'executor': write_executor, 'futures': []}
+		# One matplotlib figure per file, cleared and redrawn for each glyph
+		diagnostic_figure = None
+		if diagnostics and diagnostic_backend == 'matplotlib':
+			diagnostic_figure = visualizer.create_diagnostic_figure()
+		with render_pool, write_executor:
+			for start in range(0, len(target_chars), RENDER_THREADS):
+				chunk = target_chars[start:start + RENDER_THREADS]
+				glyph_images = list(render_pool.map(render_one, chunk))
+
+				for offset, (char_meta, glyph_image) in enumerate(zip(chunk, glyph_images)):
+					char = char_meta['character']
+					char_idx = char_counts.get(char, 0)
+					char_counts[char] = char_idx + 1
+					# Sample the PNGs; the SVG overlay still shows every fit
+					char_diagnostics = diagnostics
+					if (start + offset) % diagnostic_every != 0:
+						char_diagnostics = False
+
+					result = process_single_character(
+						svg_path, char_meta, svg_dims, svg_output_dir,
+						char_idx, zoom, verbose, svg_context, glyph_image,
+						char_diagnostics, write_pool, render_scale, diagnostic_backend,
+						diagnostic_figure
+					)
+					results.append(result)
+					_limit_pending_writes(write_pool, MAX_PENDING_WRITES)
+
+			# Wait for background PNG writes and surface any write error
+			for write_future in write_pool['futures']:
+				write_future.result()
+		if diagnostic_figure is not None:
+			visualizer.close_diagnostic_figure(diagnostic_figure)
 
 	# Save results JSON
 	results_data = {
@@ -260,11 +375,14 @@ def process_svg_file(
 	_write_summary_text(summary_path, results_data)
 
 	# Generate diagnostic SVG overlay
-	diag_svg_path = os.path.join(svg_output_dir, f'{svg_basename}_diagnostic.svg')
-	visualizer.create_diagnostic_svg_overlay(svg_path, results, diag_svg_path)
+	if diagnostics:
+		diag_svg_path = os.path.join(svg_output_dir, f'{svg_basename}_diagnostic.svg')
+		visualizer.create_diagnostic_svg_overlay(
+			svg_path, results, diag_svg_path, svg_bytes
+		)
 
-	if verbose:
-		print(f"  + Saved diagnostic SVG: {diag_svg_path}")
+		if verbose:
+			print(f"  + Saved diagnostic SVG: {diag_svg_path}")
 
 	return results_data
 
@@ -276,20 +394,41 @@ def batch_process(
 	target_letters: str = 'OC',
 	zoom: int = 10,
 	verbose: bool = False,
+	jobs: int = 1,
+	diagnostics: bool = True,
+	diagnostic_backend: str = 'matplotlib',
+	diagnostic_every: int = 1,
 ) -> dict:
 	"""
 	Process all SVG files in a directory.
 
+	Each SVG file is independent, so with jobs > 1 the files are fanned
+	out to a process pool, largest file first. jobs == 1 keeps the simple sequential loop,
+	and jobs <= 0 uses one worker per CPU core. Workers run quietly so
+	their output does not interleave; the parent prints one line per file.
+
 	Args:
 		input_dir: Directory containing SVG files
 		output_dir: Output directory
 		target_letters: Letters to analyze
 		zoom: Render zoom factor
 		verbose: Print progress
+		jobs: Number of worker processes for per-file processing
+			(0 or less for one per CPU core)
+		diagnostics: Write per-character and per-file diagnostic images
+		diagnostic_backend: Diagnostic PNG backend, 'matplotlib' or 'fast'
+		diagnostic_every: Write a diagnostic PNG for every Nth target
+			character of each file only
 
 	Returns:
 		Dict with aggregate statistics
+
+	Raises:
+		ValueError: If diagnostic_every is less than 1
 	"""
+	# Reject a bad stride before any file or worker pool is started
+	if diagnostic_every < 1:
+		raise ValueError(f"diagnostic_every must be at least 1, got {diagnostic_every}")
 	svg_pattern = os.path.join(input_dir, '*.svg')
 	svg_files = sorted(glob.glob(svg_pattern))
 
@@ -302,12 +441,43 @@ def batch_process(
 
 	os.makedirs(output_dir, exist_ok=True)
 
-	all_results = []
-	for svg_path in svg_files:
-		result = process_svg_file(
-			svg_path, output_dir, target_letters, zoom, verbose
+	if jobs <= 0:
+		jobs = os.cpu_count() or 1
+
+	# A single file gains nothing from a pool but pays its startup cost
+	if jobs == 1 or len(svg_files) < 2:
+		all_results = []
+		for svg_path in svg_files:
+			result = process_svg_file(
+				svg_path, output_dir, target_letters, zoom, verbose, diagnostics,
+				diagnostic_backend, diagnostic_every
+			)
+			all_results.append(result)
+	else:
+		# Bind the shared arguments so only the SVG path varies per task
+		# Workers stay quiet so their progress lines do not interleave
+		process_one = functools.partial(
+			process_svg_file, output_dir=output_dir,
+			target_letters=target_letters, zoom=zoom, verbose=False,
+			diagnostics=diagnostics, diagnostic_backend=diagnostic_backend,
+			diagnostic_every=diagnostic_every,
 		)
-		all_results.append(result)
+		# Largest files start first so small ones backfill idle workers
+		# instead of one big file running alone at the end
+		schedule = sorted(svg_files, key=os.path.getsize, reverse=True)
+		# Several files per task amortize pickling and queue round trips on
+		# large directories while keeping about four tasks per worker
+		chunksize = max(1, len(svg_files) // (4 * jobs))
+		results_by_path = {}
+		with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+			results = executor.map(process_one, schedule, chunksize=chunksize)
+			for svg_path, result in zip(schedule, results):
+				results_by_path[svg_path] = result
+				if verbose:
+					num_chars = len(result.get('characters', []))
+					print(f"  + {result['svg_file']}: {num_chars} characters")
+		# Report in sorted file order regardless of scheduling order
+		all_results = [results_by_path[svg_path] for svg_path in svg_files]
 
 	# Aggregate statistics
 	total_chars = sum(len(r.get('characters', [])) for r in all_results)
@@ -323,29 +493,32 @@ def batch_process(
 		'failed_characters': total_chars - successful,
 	}
 
-	# Write summary report
+	# Build the summary report in memory and write it in one call
+	report_lines = []
+	report_lines.append("Letter Glyph Ellipse Fitting Summary\n")
+	report_lines.append("=" * 50 + "\n\n")
+	report_lines.append(f"Files processed: {stats['files_processed']}\n")
+	report_lines.append(f"Total characters: {stats['total_characters']}\n")
+	report_lines.append(f"Successful: {stats['successful_characters']}\n")
+	report_lines.append(f"Failed: {stats['failed_characters']}\n\n")
+
+	for result in all_results:
+		report_lines.append(f"\n{result['svg_file']}:\n")
+		for char_result in result.get('characters', []):
+			if 'error' in char_result:
+				report_lines.append(f"  {char_result['char']} #{char_result['index']}: "
+					f"ERROR - {char_result['error']}\n")
+			else:
+				svg_e = char_result['svg_ellipse']
+				fq = char_result['fit_quality']
+				report_lines.append(f"  {char_result['char']} #{char_result['index']}: "
+					f"center=({svg_e['cx']:.2f}, {svg_e['cy']:.2f}) "
+					f"rx={svg_e['rx']:.2f} ry={svg_e['ry']:.2f} "
+					f"boundary={fq['mean_boundary_pct']:.1f}%\n")
+
 	report_path = os.path.join(output_dir, 'summary_report.txt')
 	with open(report_path, 'w') as f:
-		f.write("Letter Glyph Ellipse Fitting Summary\n")
-		f.write("=" * 50 + "\n\n")
-		f.write(f"Files processed: {stats['files_processed']}\n")
-		f.write(f"Total characters: {stats['total_characters']}\n")
-		f.write(f"Successful: {stats['successful_characters']}\n")
-		f.write(f"Failed: {stats['failed_characters']}\n\n")
-
-		for result in all_results:
-			f.write(f"\n{result['svg_file']}:\n")
-			for char_result in result.get('characters', []):
-				if 'error' in char_result:
-					f.write(f"  {char_result['char']} #{char_result['index']}: "
-						f"ERROR - {char_result['error']}\n")
-				else:
-					svg_e = char_result['svg_ellipse']
-					fq = char_result['fit_quality']
-					f.write(f"  {char_result['char']} #{char_result['index']}: "
-						f"center=({svg_e['cx']:.2f}, {svg_e['cy']:.2f}) "
-						f"rx={svg_e['rx']:.2f} ry={svg_e['ry']:.2f} "
-						f"boundary={fq['mean_boundary_pct']:.1f}%\n")
+		f.write(''.join(report_lines))
 
 	if verbose:
 		print(f"\n+ Summary report: {report_path}")
@@ -362,30 +535,35 @@ def _write_summary_text(output_path: str, results_data: dict) -> None:
 		output_path: Path to summary file
 		results_data: Results dict
 	"""
+	# Collect lines and write the file in one call
+	summary_lines = []
+	summary_lines.append(f"Analysis Results: {results_data['svg_file']}\n")
+	summary_lines.append("=" * 60 + "\n\n")
+
+	for cr in results_data['characters']:
+		if 'error' in cr:
+			summary_lines.append(f"{cr['char']} #{cr['index']}: ERROR - {cr['error']}\n\n")
+			continue
+
+		char = cr['char']
+		idx = cr['index']
+		svg_e = cr['svg_ellipse']
+		fq = cr['fit_quality']
+		ell = cr['ellipse']
+
+		summary_lines.append(f"{char} #{idx}:\n")
+		summary_lines.append(f"  SVG Ellipse Center: ({svg_e['cx']:.3f}, {svg_e['cy']:.3f})\n")
+		summary_lines.append(f"  SVG Semi-Axes: rx={svg_e['rx']:.3f}  ry={svg_e['ry']:.3f}\n")
+		summary_lines.append(f"  Eccentricity: {ell['eccentricity']:.4f}\n")
+		summary_lines.append(f"  Convex Hull Area: {cr['convex_hull']['area']:.1f} px^2\n")
+		summary_lines.append("  Fit Quality:\n")
+		summary_lines.append(f"    Center offset: {fq['center_offset_pct']:.2f}%\n")
+		summary_lines.append(f"    Mean boundary dist: {fq['mean_boundary_pct']:.2f}%\n")
+		summary_lines.append(f"    Max boundary dist: {fq['max_boundary_pct']:.2f}%\n")
+		summary_lines.append(f"    Coverage: {fq['coverage']:.1%}\n")
+		if cr['diagnostic_file']:
+			summary_lines.append(f"  Diagnostic: {cr['diagnostic_file']}\n")
+		summary_lines.append("\n" + "-" * 60 + "\n\n")
+
 	with open(output_path, 'w') as f:
-		f.write(f"Analysis Results: {results_data['svg_file']}\n")
-		f.write("=" * 60 + "\n\n")
-
-		for cr in results_data['characters']:
-			if 'error' in cr:
-				f.write(f"{cr['char']} #{cr['index']}: ERROR - {cr['error']}\n\n")
-				continue
-
-			char = cr['char']
-			idx = cr['index']
-			svg_e = cr['svg_ellipse']
-			fq = cr['fit_quality']
-			ell = cr['ellipse']
-
-			f.write(f"{char} #{idx}:\n")
-			f.write(f"  SVG Ellipse Center: ({svg_e['cx']:.3f}, {svg_e['cy']:.3f})\n")
-			f.write(f"  SVG Semi-Axes: rx={svg_e['rx']:.3f}  ry={svg_e['ry']:.3f}\n")
-			f.write(f"  Eccentricity: {ell['eccentricity']:.4f}\n")
-			f.write(f"  Convex Hull Area: {cr['convex_hull']['area']:.1f} px^2\n")
-			f.write("  Fit Quality:\n")
-			f.write(f"    Center offset: {fq['center_offset_pct']:.2f}%\n")
-			f.write(f"    Mean boundary dist: {fq['mean_boundary_pct']:.2f}%\n")
-			f.write(f"    Max boundary dist: {fq['max_boundary_pct']:.2f}%\n")
-			f.write(f"    Coverage: {fq['coverage']:.1%}\n")
-			f.write(f"  Diagnostic: {cr['diagnostic_file']}\n")
-			f.write("\n" + "-" * 60 + "\n\n")
+		f.write(''.join(summary_lines))
@@ -6,46 +6,104 @@ Font metric constants ported from bkchem/tools/measure_glyph_bond_alignment.py.
 Also provides viewBox extraction and SVG-to-pixel coordinate mapping.
 """
 
+import re
+import sys
+import types
+import functools
 import xml.etree.ElementTree as ET
 
 # SVG namespace used in target files
 SVG_NS = "http://www.w3.org/2000/svg"
+# Clark-qualified tags, so lookups need no namespace prefix map
+_TEXT_TAG = f'{{{SVG_NS}}}text'
+_TSPAN_TAG = f'{{{SVG_NS}}}tspan'
+
+# Target letters located by _extract_chars_from_string
+TARGET_CHAR_PATTERN = re.compile('[OC]')
+# One CSS declaration in a style attribute: key up to the first colon,
+# value up to the next semicolon
+STYLE_DECLARATION_PATTERN = re.compile('([^;:]*):([^;]*)')
+
+# Advance width ratios (times font size) keyed by uppercase character
+_ADVANCE_RATIO = {
+	**dict.fromkeys('IL1', 0.38),
+	**dict.fromkeys('WM', 0.82),
+	**dict.fromkeys('OCSQGDU0698', 0.62),
+	**dict.fromkeys('HNPTFKEXY', 0.58),
+}
+
+# Round glyphs sit a bit lower: (top, bottom) ratios around the baseline
+_ROUND_VERTICAL_RATIO = (0.78, 0.16)
+_DEFAULT_VERTICAL_RATIO = (0.80, 0.20)
+_VERTICAL_RATIO = dict.fromkeys('COSQGD', _ROUND_VERTICAL_RATIO)
+
+# Fraction of the text width that text-anchor shifts the start position
+# left; 'start' and unknown anchors are absent and shift by zero
+_ANCHOR_SHIFT = {'middle': 0.5, 'end': 1.0}
 
 
 #============================================
+@functools.lru_cache(maxsize=4096)
 def _glyph_char_advance(font_size: float, char: str) -> float:
 	"""Estimated horizontal advance for one character."""
 	size = max(1.0, float(font_size))
-	upper = char.upper()
-	if upper in ('I', 'L', '1'):
-		return size * 0.38
-	if upper in ('W', 'M'):
-		return size * 0.82
-	if upper in ('O', 'C', 'S', 'Q', 'G', 'D', 'U', '0', '6', '9', '8'):
-		return size * 0.62
-	if upper in ('H', 'N', 'P', 'T', 'F', 'K', 'E', 'X', 'Y'):
-		return size * 0.58
-	if char.isdigit():
-		return size * 0.52
-	if char.islower():
-		return size * 0.50
-	return size * 0.56  # default
+	ratio = _ADVANCE_RATIO.get(char.upper())
+	if ratio is None:
+		if char.isdigit():
+			ratio = 0.52
+		elif char.islower():
+			ratio = 0.50
+		else:
+			ratio = 0.56  # default
+	return size * ratio
+
+
+#============================================
+@functools.lru_cache(maxsize=4096)
+def _glyph_char_vertical_extent(font_size: float, char: str) -> tuple:
+	"""Return (ascent, descent) of a character around its baseline."""
+	size = max(1.0, float(font_size))
+	top_ratio, bottom_ratio = _VERTICAL_RATIO.get(char.upper(), _DEFAULT_VERTICAL_RATIO)
+	return (size * top_ratio, size * bottom_ratio)
 
 
 #============================================
 def _glyph_char_vertical_bounds(baseline_y: float, font_size: float, char: str) -> tuple:
 	"""Return (top_y, bottom_y) for a character at baseline_y."""
+	# The baseline varies per run, so only the (font_size, char) part is cached
+	ascent, descent = _glyph_char_vertical_extent(font_size, char)
+	return (baseline_y - ascent, baseline_y + descent)
+
+
+#============================================
+@functools.lru_cache(maxsize=2048)
+def _glyph_char_advances(text: str, font_size: float) -> tuple:
+	"""Per-character advances of a text run; labels repeat across a file."""
+	upper_text = text.upper()
+	# Case mapping can change the length (e.g. German sharp s), which
+	# would misalign the pairs below
+	if len(upper_text) != len(text):
+		advances = tuple(_glyph_char_advance(font_size, c) for c in text)
+		return advances
+	# Uppercase the run once and look up table letters directly; only
+	# characters outside the table go through the per-char fallback
 	size = max(1.0, float(font_size))
-	upper = char.upper()
-	if upper in ('C', 'O', 'S', 'Q', 'G', 'D'):
-		return (baseline_y - size * 0.78, baseline_y + size * 0.16)
-	return (baseline_y - size * 0.80, baseline_y + size * 0.20)
+	advance_list = []
+	for char, upper_char in zip(text, upper_text):
+		ratio = _ADVANCE_RATIO.get(upper_char)
+		if ratio is None:
+			advance_list.append(_glyph_char_advance(font_size, char))
+		else:
+			advance_list.append(size * ratio)
+	advances = tuple(advance_list)
+	return advances
 
 
 #============================================
+@functools.lru_cache(maxsize=2048)
 def _glyph_text_width(text: str, font_size: float) -> float:
 	"""Total text width from per-character advances."""
-	advances = [_glyph_char_advance(font_size, c) for c in text]
+	advances = _glyph_char_advances(text, font_size)
 	tracking = max(0.0, font_size) * 0.04
 	return sum(advances) + tracking * max(0, len(advances) - 1)
 
@@ -61,9 +119,13 @@ def get_svg_dimensions(svg_path: str) -> dict:
 	Returns:
 		Dict with viewBox (x, y, width, height), viewport_width, viewport_height
 	"""
-	tree = ET.parse(svg_path)  # nosec B314 - local SVG files only
-	root = tree.getroot()
-	return _get_dimensions_from_root(root)
+	# Only the root element's attributes are needed, so stop streaming at
+	# the first start event instead of building the whole tree
+	with open(svg_path, 'rb') as svg_file:
+		for _, root in ET.iterparse(svg_file, events=('start',)):  # nosec B314 - local SVG files only
+			break
+	svg_dims = _get_dimensions_from_root(root)
+	return svg_dims
 
 
 #============================================
@@ -103,20 +165,37 @@ def _get_dimensions_from_root(root) -> dict:
 
 
 #============================================
-def svg_to_pixel(svg_x: float, svg_y: float, svg_dims: dict, zoom: float = 1.0) -> tuple:
+def get_render_scale(svg_dims: dict, zoom: float = 1.0) -> float:
 	"""
-	Convert SVG coordinates to pixel coordinates.
+	Pixels per SVG user unit for a render at the given zoom.
+
+	Assumes preserveAspectRatio="xMidYMid meet" (the SVG default), so the
+	smaller of the horizontal and vertical scales applies.
+
+	Args:
+		svg_dims: Dict from get_svg_dimensions()
+		zoom: Render zoom factor (default 1.0)
+
+	Returns:
+		Scale factor from SVG units to pixels
+	"""
+	scale = _viewbox_transform(svg_dims, zoom)['scale']
+	return scale
+
+
+#============================================
+def _viewbox_transform(svg_dims: dict, zoom: float = 1.0) -> dict:
+	"""
+	Scale and offsets mapping SVG user units to render pixels.
 
 	Assumes preserveAspectRatio="xMidYMid meet" (the SVG default).
 
 	Args:
-		svg_x: X coordinate in SVG user units
-		svg_y: Y coordinate in SVG user units
 		svg_dims: Dict from get_svg_dimensions()
 		zoom: Render zoom factor (default 1.0)
 
 	Returns:
-		Tuple (pixel_x, pixel_y)
+		Dict with scale, offset_x, offset_y, vb_x, vb_y
 	"""
 	vb = svg_dims['viewBox']
 	vp_w = svg_dims['viewport_width'] * zoom
@@ -127,11 +206,35 @@ def svg_to_pixel(svg_x: float, svg_y: float, svg_dims: dict, zoom: float = 1.0)
 	rendered_w = vb['width'] * scale
 	rendered_h = vb['height'] * scale
 	# Center in viewport (xMid, YMid)
-	offset_x = (vp_w - rendered_w) / 2.0
-	offset_y = (vp_h - rendered_h) / 2.0
+	transform = {
+		'scale': scale,
+		'offset_x': (vp_w - rendered_w) / 2.0,
+		'offset_y': (vp_h - rendered_h) / 2.0,
+		'vb_x': vb['x'],
+		'vb_y': vb['y'],
+	}
+	return transform
 
-	px = (svg_x - vb['x']) * scale + offset_x
-	py = (svg_y - vb['y']) * scale + offset_y
+
+#============================================
+def svg_to_pixel(svg_x: float, svg_y: float, svg_dims: dict, zoom: float = 1.0) -> tuple:
+	"""
+	Convert SVG coordinates to pixel coordinates.
+
+	Assumes preserveAspectRatio="xMidYMid meet" (the SVG default).
+
+	Args:
+		svg_x: X coordinate in SVG user units
+		svg_y: Y coordinate in SVG user units
+		svg_dims: Dict from get_svg_dimensions()
+		zoom: Render zoom factor (default 1.0)
+
+	Returns:
+		Tuple (pixel_x, pixel_y)
+	"""
+	tf = _viewbox_transform(svg_dims, zoom)
+	px = (svg_x - tf['vb_x']) * tf['scale'] + tf['offset_x']
+	py = (svg_y - tf['vb_y']) * tf['scale'] + tf['offset_y']
 	return (px, py)
 
 
@@ -151,18 +254,9 @@ def pixel_to_svg(pixel_x: float, pixel_y: float, svg_dims: dict, zoom: float = 1
 	Returns:
 		Tuple (svg_x, svg_y)
 	"""
-	vb = svg_dims['viewBox']
-	vp_w = svg_dims['viewport_width'] * zoom
-	vp_h = svg_dims['viewport_height'] * zoom
-
-	scale = min(vp_w / vb['width'], vp_h / vb['height'])
-	rendered_w = vb['width'] * scale
-	rendered_h = vb['height'] * scale
-	offset_x = (vp_w - rendered_w) / 2.0
-	offset_y = (vp_h - rendered_h) / 2.0
-
-	sx = (pixel_x - offset_x) / scale + vb['x']
-	sy = (pixel_y - offset_y) / scale + vb['y']
+	tf = _viewbox_transform(svg_dims, zoom)
+	sx = (pixel_x - tf['offset_x']) / tf['scale'] + tf['vb_x']
+	sy = (pixel_y - tf['offset_y']) / tf['scale'] + tf['vb_y']
 	return (sx, sy)
 
 
@@ -177,25 +271,106 @@ def parse_svg_file(svg_path: str) -> list:
 	- _tspan_index: index of the <tspan> within the text element, or None
 	- _char_offset: character offset within the text/tspan string
 
+	Reads the file and hands its bytes to parse_svg_string(). Callers
+	that already hold a parsed root should use parse_svg_root() instead.
+
 	Args:
 		svg_path: Path to SVG file
 
 	Returns:
 		List of character metadata dicts
 	"""
-	tree = ET.parse(svg_path)  # nosec B314 - local SVG files only
-	root = tree.getroot()
+	with open(svg_path, 'rb') as svg_file:
+		svg_bytes = svg_file.read()
+	characters = parse_svg_string(svg_bytes)
+	return characters
 
-	# SVG namespace
-	ns = {'svg': SVG_NS}
 
+#============================================
+def parse_svg_string(svg_text) -> list:
+	"""
+	Extract all O and C characters from SVG contents held in memory.
+
+	Args:
+		svg_text: SVG document as str or bytes
+
+	Returns:
+		List of character metadata dicts as from parse_svg_file()
+	"""
 	characters = []
+	# A document without any O/C cannot hold a target letter; character
+	# references such as &#79; could spell one, so those still get parsed
+	if not may_contain_targets(svg_text):
+		return characters
+	root = ET.fromstring(svg_text)  # nosec B314 - local SVG files only
+	characters = _extract_characters_from_root(root)
+	return characters
 
-	# Find all text elements and track their index
-	text_elements = root.findall(f'.//{{{SVG_NS}}}text')
+
+#============================================
+def may_contain_targets(svg_text) -> bool:
+	"""
+	Substring scan for anything that could decode to a target letter.
+
+	Cheap enough to run on raw file bytes before any XML parsing.
+
+	Args:
+		svg_text: SVG document as str or bytes
+
+	Returns:
+		False only when the document has no 'O', no 'C' and no character
+		reference
+	"""
+	# Empty input goes on to the parser, which reports it
+	if not svg_text:
+		return True
+	markers = ('O', 'C', '&#')
+	if isinstance(svg_text, bytes):
+		markers = (b'O', b'C', b'&#')
+	for marker in markers:
+		if marker in svg_text:
+			return True
+	return False
+
+
+#============================================
+def parse_svg_root(root) -> tuple:
+	"""
+	Dimensions and O/C characters from an already parsed SVG root.
+
+	Lets callers that keep the parsed tree (e.g. for isolation renders)
+	avoid parsing the file again.
+
+	Args:
+		root: XML root element of SVG
+
+	Returns:
+		Tuple (svg_dims, characters)
+	"""
+	svg_dims = _get_dimensions_from_root(root)
+	characters = _extract_characters_from_root(root)
+	return (svg_dims, characters)
+
+
+#============================================
+def _extract_characters_from_root(root) -> list:
+	"""
+	Extract O/C characters from every <text> element under an SVG root.
+
+	Args:
+		root: XML root element of SVG
+
+	Returns:
+		List of character metadata dicts
+	"""
+	characters = []
+
+	# Walk text elements in document order and track their index; iter()
+	# matches the tag in C without compiling a findall path
+	text_elements = root.iter(_TEXT_TAG)
 	for text_idx, text_elem in enumerate(text_elements):
 		chars_in_element = _extract_characters_from_text_element(
-			text_elem, ns, text_idx
+			text_elem, text_elem_index=text_idx
 		)
 		characters.extend(chars_in_element)
 
@@ -203,13 +378,12 @@ def parse_svg_file(svg_path: str) -> list:
 
 
 #============================================
-def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int) -> list:
+def _extract_characters_from_text_element(elem, text_elem_index: int = 0) -> list:
 	"""
 	Extract O/C characters from text element including tspans.
 
 	Args:
 		elem: XML element (text element)
-		ns: Namespace dict
 		text_elem_index: Index of this text element among all text elements
 
 	Returns:
@@ -217,11 +391,17 @@ def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int)
 	"""
 	characters = []
 
+	# Element text gathered without serializing the subtree; elements with
+	# no target letters anywhere are skipped before any attribute parsing
+	element_text = ''.join(elem.itertext())
+	if not TARGET_CHAR_PATTERN.search(element_text):
+		return characters
+
 	# Get default attributes from text element
-	base_x = float(elem.get('x', '0'))
-	base_y = float(elem.get('y', '0'))
+	base_x = _float_attr(elem, 'x', 0.0)
+	base_y = _float_attr(elem, 'y', 0.0)
 	base_font_family = elem.get('font-family', 'sans-serif')
-	base_font_size = float(elem.get('font-size', '12'))
+	base_font_size = _float_attr(elem, 'font-size', 12.0)
 	base_font_weight = elem.get('font-weight', 'normal')
 	base_fill = elem.get('fill', '#000000')
 	base_text_anchor = elem.get('text-anchor', 'start')
@@ -231,13 +411,14 @@ def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int)
 	if style:
 		style_dict = _parse_style_attribute(style)
 		base_font_family = style_dict.get('font-family', base_font_family)
-		base_font_size = float(style_dict.get('font-size', str(base_font_size)).replace('px', ''))
+		base_font_size = _float_attr(style_dict, 'font-size', base_font_size)
 		base_font_weight = style_dict.get('font-weight', base_font_weight)
 		base_fill = style_dict.get('fill', base_fill)
 		base_text_anchor = style_dict.get('text-anchor', base_text_anchor)
 
-	# Get full source text for debugging
-	source_text = ET.tostring(elem, encoding='unicode', method='text').strip()
+	# Get full source text for debugging (text-method serialization also
+	# appends the element tail, kept here for identical output)
+	source_text = (element_text + (elem.tail or '')).strip()
 
 	# Check direct text content (no tspan)
 	direct_text = elem.text or ''
@@ -248,15 +429,13 @@ def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int)
 		tspan_index=None,
 	))
 
-	# Check tspan elements
-	tspan_tag = f'{{{SVG_NS}}}tspan'
-	tspan_children = [child for child in elem if child.tag == tspan_tag]
-	for tspan_idx, tspan in enumerate(tspan_children):
+	# Check direct tspan children
+	for tspan_idx, tspan in enumerate(elem.iterfind(_TSPAN_TAG)):
 		# Get tspan-specific attributes (or inherit from parent)
-		tspan_x = float(tspan.get('x', str(base_x)))
-		tspan_y = float(tspan.get('y', str(base_y)))
+		tspan_x = _float_attr(tspan, 'x', base_x)
+		tspan_y = _float_attr(tspan, 'y', base_y)
 		tspan_font_family = tspan.get('font-family', base_font_family)
-		tspan_font_size = float(tspan.get('font-size', str(base_font_size)))
+		tspan_font_size = _float_attr(tspan, 'font-size', base_font_size)
 		tspan_font_weight = tspan.get('font-weight', base_font_weight)
 		tspan_fill = tspan.get('fill', base_fill)
 		tspan_text_anchor = tspan.get('text-anchor', base_text_anchor)
@@ -266,7 +445,7 @@ def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int)
 		if tspan_style:
 			style_dict = _parse_style_attribute(tspan_style)
 			tspan_font_family = style_dict.get('font-family', tspan_font_family)
-			tspan_font_size = float(style_dict.get('font-size', str(tspan_font_size)).replace('px', ''))
+			tspan_font_size = _float_attr(style_dict, 'font-size', tspan_font_size)
 			tspan_font_weight = style_dict.get('font-weight', tspan_font_weight)
 			tspan_fill = style_dict.get('fill', tspan_fill)
 			tspan_text_anchor = style_dict.get('text-anchor', tspan_text_anchor)
@@ -283,23 +462,50 @@ def _extract_characters_from_text_element(elem, ns: dict, text_elem_index: int)
 
 
 #============================================
-def _parse_style_attribute(style: str) -> dict:
+def _float_attr(attrs, key: str, default: float) -> float:
+	"""
+	Read a numeric attribute, returning the default float when it is absent.
+
+	Args:
+		attrs: Element or style mapping with a get() method
+		key: Attribute or style property name
+		default: Value returned when the key is missing
+
+	Returns:
+		Attribute value as float, with a trailing 'px' unit removed
+	"""
+	value = attrs.get(key)
+	if value is None:
+		return default
+	if value.endswith('px'):
+		value = value[:-2]
+	number = float(value)
+	return number
+
+
+#============================================
+@functools.lru_cache(maxsize=1024)
+def _parse_style_attribute(style: str) -> types.MappingProxyType:
 	"""
 	Parse CSS style attribute into dict.
 
+	Generated SVGs repeat the same style strings many times, so results
+	are cached; the returned mapping is read-only because it is shared.
+
 	Args:
 		style: CSS style string (e.g., "font-size:12px;fill:#000")
 
 	Returns:
-		Dict of style properties
+		Read-only dict of style properties
 	"""
-	style_dict = {}
-	for item in style.split(';'):
-		item = item.strip()
-		if ':' in item:
-			key, value = item.split(':', 1)
-			style_dict[key.strip()] = value.strip()
-	return style_dict
+	# One C-level scan finds every key:value declaration; text between
+	# semicolons that has no colon never matches
+	style_dict = {
+		key.strip(): value.strip()
+		for key, value in STYLE_DECLARATION_PATTERN.findall(style)
+	}
+	style_view = types.MappingProxyType(style_dict)
+	return style_view
 
 
 #============================================
@@ -340,58 +546,110 @@ def _extract_chars_from_string(
 	"""
 	characters = []
 
-	if not text:
+	# Most text runs hold no target letters (H, N, CH3 labels aside); two
+	# substring scans reject them before the regex and metric walk
+	if 'O' not in text and 'C' not in text:
 		return characters
+	matches = list(TARGET_CHAR_PATTERN.finditer(text))
 
-	# Compute cursor_x based on text_anchor
-	text_width = _glyph_text_width(text, font_size)
+	# Each element hands back fresh attribute strings; interning makes
+	# every character across the file share one copy per distinct value
+	font_family = sys.intern(font_family)
+	font_weight = sys.intern(font_weight)
+	fill = sys.intern(fill)
+
+	# One cached advance table serves both the width and the cursor walk
+	advances = _glyph_char_advances(text, font_size)
+
+	# Compute cursor_x based on text_anchor; start-anchored text (the
+	# common case) needs no total width
 	tracking = max(0.0, font_size) * 0.04
 
-	if text_anchor == 'middle':
-		cursor_x = x - text_width * 0.5
-	elif text_anchor == 'end':
-		cursor_x = x - text_width
-	else:  # 'start'
-		cursor_x = x
-
-	# Walk through characters, accumulating advance widths
-	for i, char in enumerate(text):
-		advance = _glyph_char_advance(font_size, char)
-
-		if char in ('O', 'C'):
-			# Character center x = left edge + half advance
-			char_cx = cursor_x + advance * 0.5
-			# Character center y from vertical bounds
+	cursor_x = x
+	anchor_shift = _ANCHOR_SHIFT.get(text_anchor, 0.0)
+	if anchor_shift:
+		text_width = _glyph_text_width(text, font_size)
+		cursor_x = x - text_width * anchor_shift
+
+	# Jump from match to match, accumulating advance widths of the
+	# characters in between (every char before a match has a successor,
+	# so each one adds its advance plus tracking)
+	position = 0
+	# Vertical center depends only on the letter for a fixed baseline and
+	# size, so compute it once per distinct letter in this run
+	center_y_by_char = {}
+	for match in matches:
+		i = match.start()
+		char = match.group()
+		for skipped in range(position, i):
+			cursor_x += advances[skipped] + tracking
+		position = i
+
+		advance = advances[i]
+		# Character center x = left edge + half advance
+		char_cx = cursor_x + advance * 0.5
+		# Character center y from vertical bounds
+		char_cy = center_y_by_char.get(char)
+		if char_cy is None:
 			top_y, bottom_y = _glyph_char_vertical_bounds(y, font_size, char)
 			char_cy = (top_y + bottom_y) * 0.5
-
-			characters.append({
-				'character': char,
-				'x': cursor_x,
-				'y': y,
-				'cx': char_cx,
-				'cy': char_cy,
-				'font_family': font_family,
-				'font_size': font_size,
-				'font_weight': font_weight,
-				'fill_color': fill,
-				'source_text': source_text,
-				'char_index': i,
-				# Element identification for isolation SVG builder
-				'_text_elem_index': text_elem_index,
-				'_tspan_index': tspan_index,
-				'_char_offset': i,
-			})
-
-		# Advance cursor: char advance + tracking (except after last char)
-		if i < len(text) - 1:
-			cursor_x += advance + tracking
-		else:
-			cursor_x += advance
+			center_y_by_char[char] = char_cy
+
+		characters.append({
+			'character': char,
+			'x': cursor_x,
+			'y': y,
+			'cx': char_cx,
+			'cy': char_cy,
+			'font_family': font_family,
+			'font_size': font_size,
+			'font_weight': font_weight,
+			'fill_color': fill,
+			'source_text': source_text,
+			'char_index': i,
+			# Element identification for isolation SVG builder
+			'_text_elem_index': text_elem_index,
+			'_tspan_index': tspan_index,
+			'_char_offset': i,
+		})
 
 	return characters
 
 
-# Keep old name as alias for backward compatibility in tests
-parse_style_attribute = _parse_style_attribute
-extract_characters_from_text_element = _extract_characters_from_text_element
+#============================================
+def parse_style_attribute(style: str) -> dict:
+	"""
+	Parse CSS style attribute into a new, mutable dict.
+
+	Public form of the cached _parse_style_attribute(); the copy keeps
+	callers from editing the shared cached mapping.
+
+	Args:
+		style: CSS style string (e.g., "font-size:12px;fill:#000")
+
+	Returns:
+		Dict of style properties
+	"""
+	style_dict = dict(_parse_style_attribute(style))
+	return style_dict
+
+
+#============================================
+def extract_characters_from_text_element(elem, ns: dict = None,
+	text_elem_index: int = 0) -> list:
+	"""
+	Extract O/C characters from text element including tspans.
+
+	Public form of _extract_characters_from_text_element() that keeps the
+	original (elem, ns, text_elem_index) signature.
+
+	Args:
+		elem: XML element (text element)
+		ns: Ignored; tags are matched by their namespace-qualified names
+		text_elem_index: Index of this text element among all text elements
+
+	Returns:
+		List of character metadata dicts for each O or C found
+	"""
+	characters = _extract_characters_from_text_element(elem, text_elem_index)
+	return characters
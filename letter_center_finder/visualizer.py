@@ -5,14 +5,56 @@ Creates multi-panel plots showing the isolation render, binary mask,
 contour with convex hull, and fitted ellipse overlay.
 """
 
+import re
+
 import numpy
+import cv2
+import PIL.Image
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot
+import matplotlib.path
 import matplotlib.patches
+import xml.sax.saxutils
 import xml.etree.ElementTree as ET
 
 SVG_NS = "http://www.w3.org/2000/svg"
+# Closing root tag, with or without a namespace prefix (e.g. </ns0:svg>)
+_SVG_CLOSE_PATTERN = re.compile(rb'</(?:[A-Za-z_][\w.-]*:)?svg\s*>')
+# Color palette cycled across characters in the SVG overlay
+OVERLAY_COLORS = ('#ff3333', '#3366ff', '#33cc33', '#ff9900', '#cc33ff', '#00cccc')
+# Stroke settings shared by every overlay ellipse
+_ELLIPSE_STROKE_ATTRS = 'stroke-width="0.4" stroke-opacity="0.85" fill="none"'
+
+# Diagnostic PNG resolution (the 12 in figure is 1200 px square before the
+# tight crop) and the margin savefig(bbox_inches='tight') adds
+DIAGNOSTIC_DPI = 100
+TIGHT_PAD_INCHES = 0.1
+# zlib level for diagnostic PNGs; 3 encodes about 1.5x faster than the
+# Pillow default of 6 for roughly 30% larger files
+PNG_COMPRESS_LEVEL = 3
+
+# Diagnostic PNG backends: full matplotlib figure, or cv2 panel compositing
+DIAGNOSTIC_BACKENDS = ('matplotlib', 'fast')
+# Fast backend: panel upscale factor, fixed-point bits for sub-pixel
+# drawing, and BGR colors matching the matplotlib panels
+FAST_PANEL_SCALE = 2
+FAST_SHIFT_BITS = 4
+FAST_CONTOUR_BGR = (0, 128, 0)
+FAST_HULL_BGR = (255, 0, 0)
+FAST_ELLIPSE_BGR = (0, 0, 255)
+
+# Unit circle for drawing fitted ellipses as a 64-segment closed line
+_UNIT_CIRCLE_THETA = numpy.linspace(0.0, 2.0 * numpy.pi, 65)
+_UNIT_CIRCLE_COS = numpy.cos(_UNIT_CIRCLE_THETA)
+_UNIT_CIRCLE_SIN = numpy.sin(_UNIT_CIRCLE_THETA)
+
+# Subplot margins for the 12x12 in diagnostic figure: room for the title
+# and legend on top, the summary box below, and tick labels on the left
+DIAGNOSTIC_SUBPLOT_PARAMS = {
+	'left': 0.04, 'right': 0.98, 'bottom': 0.09, 'top': 0.92,
+	'wspace': 0.1, 'hspace': 0.12,
+}
 
 
 #============================================
@@ -25,7 +67,10 @@ def create_diagnostic_plot(
 	fit_quality: dict,
 	output_path: str,
 	character: str,
-) -> None:
+	write_executor=None,
+	backend: str = 'matplotlib',
+	figure: dict = None,
+):
 	"""
 	Create multi-panel diagnostic PNG for one glyph.
 
@@ -44,8 +89,37 @@ def create_diagnostic_plot(
 		fit_quality: Fit quality metrics dict
 		output_path: Path to save the PNG
 		character: Character label ('O' or 'C')
+		write_executor: Optional concurrent.futures executor; when given,
+			PNG encoding and the file write run on it after the figure is
+			rasterized here
+		backend: 'matplotlib' for the full figure, or 'fast' for cv2-drawn
+			panels without matplotlib's per-figure cost
+		figure: Optional dict from create_diagnostic_figure() to clear and
+			draw on; a figure is created and closed here when not given
+
+	Returns:
+		Future for the background write, or None when written inline
 	"""
-	fig, axes = matplotlib.pyplot.subplots(2, 2, figsize=(12, 12))
+	if backend not in DIAGNOSTIC_BACKENDS:
+		raise ValueError(f"Unknown diagnostic backend: {backend}")
+	if backend == 'fast':
+		bgr = _render_fast_panels(
+			glyph_image, binary_mask, contour_points, hull_vertices,
+			ellipse_params, fit_quality, character
+		)
+		if write_executor is None:
+			_write_bgr_png(bgr, output_path)
+			return None
+		write_future = write_executor.submit(_write_bgr_png, bgr, output_path)
+		return write_future
+
+	owns_figure = figure is None
+	if owns_figure:
+		figure = create_diagnostic_figure()
+	else:
+		_clear_diagnostic_figure(figure)
+	fig = figure['fig']
+	axes = figure['axes']
 	fig.suptitle(f"Character: {character}", fontsize=16, fontweight='bold')
 
 	# Panel 1: Isolation render
@@ -60,40 +134,51 @@ def create_diagnostic_plot(
 	ax.set_title('Binary Mask')
 	ax.axis('off')
 
+	# Hull outline built once; both overlay panels wrap the same Path
+	hull_path = None
+	if len(hull_vertices) > 0:
+		closed_vertices = numpy.vstack([hull_vertices, hull_vertices[:1]])
+		hull_path = matplotlib.path.Path(closed_vertices, closed=True)
+
 	# Panel 3: Contour + convex hull
 	ax = axes[1, 0]
 	ax.imshow(glyph_image, cmap='gray', origin='upper', alpha=0.3)
+	_fix_image_limits(ax, glyph_image.shape)
 	ax.plot(contour_points[:, 0], contour_points[:, 1],
 		'g.', markersize=1, label='Contour')
-	if len(hull_vertices) > 0:
-		hull_poly = matplotlib.patches.Polygon(
-			hull_vertices, fill=False, edgecolor='blue',
+	if hull_path is not None:
+		hull_patch = matplotlib.patches.PathPatch(
+			hull_path, fill=False, edgecolor='blue',
 			linewidth=2, label='Convex Hull'
 		)
-		ax.add_patch(hull_poly)
+		ax.add_patch(hull_patch)
 	ax.set_title('Contour + Convex Hull')
-	ax.legend(fontsize=8)
-	ax.set_aspect('equal')
+	ax.set_aspect('equal', adjustable='box')
 
 	# Panel 4: All overlays including fitted ellipse
 	ax = axes[1, 1]
 	ax.imshow(glyph_image, cmap='gray', origin='upper', alpha=0.3)
+	_fix_image_limits(ax, glyph_image.shape)
 	ax.plot(contour_points[:, 0], contour_points[:, 1],
 		'g.', markersize=1, label='Contour')
-	if len(hull_vertices) > 0:
-		hull_poly = matplotlib.patches.Polygon(
-			hull_vertices, fill=False, edgecolor='blue',
+	if hull_path is not None:
+		hull_patch = matplotlib.patches.PathPatch(
+			hull_path, fill=False, edgecolor='blue',
 			linewidth=1.5, label='Hull', linestyle='--'
 		)
-		ax.add_patch(hull_poly)
+		ax.add_patch(hull_patch)
 	# Draw fitted ellipse
 	_draw_ellipse_on_axis(ax, ellipse_params, 'red', 'Fitted Ellipse')
 	# Draw center marker
 	cx, cy = ellipse_params['center']
 	ax.plot(cx, cy, 'r+', markersize=12, markeredgewidth=2, label='Center')
 	ax.set_title('Ellipse Fit Overlay')
-	ax.legend(fontsize=8)
-	ax.set_aspect('equal')
+	ax.set_aspect('equal', adjustable='box')
+
+	# One figure legend from the last panel, which holds every overlay
+	# style, in place of a legend per panel
+	handles, labels = ax.get_legend_handles_labels()
+	fig.legend(handles, labels, loc='upper right', ncol=len(handles), fontsize=8)
 
 	# Summary text below plots
 	summary = (
@@ -109,9 +194,272 @@ def create_diagnostic_plot(
 	fig.text(0.5, 0.02, summary, ha='center', fontsize=9, family='monospace',
 		bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-	matplotlib.pyplot.tight_layout(rect=[0, 0.06, 1, 0.96])
-	matplotlib.pyplot.savefig(output_path, dpi=150, bbox_inches='tight')
-	matplotlib.pyplot.close()
+	rgba = _render_figure_rgba(fig, DIAGNOSTIC_DPI)
+	if owns_figure:
+		close_diagnostic_figure(figure)
+
+	# Rasterized pixels no longer depend on the figure, so the PNG encode
+	# and write can overlap with the next glyph's work
+	if write_executor is None:
+		_write_png(rgba, output_path)
+		return None
+	write_future = write_executor.submit(_write_png, rgba, output_path)
+	return write_future
+
+
+#============================================
+def create_diagnostic_figure() -> dict:
+	"""
+	Create the 2x2 matplotlib figure used by create_diagnostic_plot().
+
+	Creating the figure and its four axes is the costliest matplotlib
+	step, so callers drawing many glyphs create one and pass it to every
+	create_diagnostic_plot() call, then close it with
+	close_diagnostic_figure(). Draw on one thread only (pyplot is not
+	thread-safe).
+
+	Returns:
+		Dict with 'fig' (matplotlib Figure) and 'axes' (2x2 axes array)
+	"""
+	fig, axes = matplotlib.pyplot.subplots(2, 2, figsize=(12, 12))
+	# Fixed margins replace a tight_layout text-measuring pass per glyph
+	fig.subplots_adjust(**DIAGNOSTIC_SUBPLOT_PARAMS)
+	figure = {'fig': fig, 'axes': axes}
+	return figure
+
+
+#============================================
+def _clear_diagnostic_figure(figure: dict) -> None:
+	"""
+	Clear a diagnostic figure from the previous glyph for reuse.
+
+	Args:
+		figure: Dict from create_diagnostic_figure()
+	"""
+	for ax in figure['axes'].flat:
+		ax.clear()
+	# The summary box and legend from the previous glyph are figure-level
+	fig = figure['fig']
+	for text in list(fig.texts):
+		text.remove()
+	for legend in list(fig.legends):
+		legend.remove()
+
+
+#============================================
+def close_diagnostic_figure(figure: dict) -> None:
+	"""
+	Release a figure from create_diagnostic_figure().
+
+	Args:
+		figure: Dict from create_diagnostic_figure()
+	"""
+	matplotlib.pyplot.close(figure['fig'])
+
+
+#============================================
+def _fix_image_limits(ax, image_shape: tuple) -> None:
+	"""
+	Pin axis limits to the image extent and turn off autoscaling.
+
+	The overlays drawn after the image lie inside the padded crop, so the
+	limits are known up front; fixing them skips the autoscale pass over
+	every contour point and patch added afterwards.
+
+	Args:
+		ax: Matplotlib axis holding the image
+		image_shape: Shape of the displayed image (rows, cols)
+	"""
+	height, width = image_shape[:2]
+	# imshow extents put pixel centers on integer coordinates
+	ax.set_xlim(-0.5, width - 0.5)
+	ax.set_ylim(height - 0.5, -0.5)
+	ax.set_autoscale_on(False)
+
+
+#============================================
+def _render_figure_rgba(fig, dpi: int) -> numpy.ndarray:
+	"""
+	Rasterize a figure and crop it like savefig(bbox_inches='tight').
+
+	Drawing once and cropping the canvas avoids the second full draw
+	that savefig does for a tight bounding box.
+
+	Args:
+		fig: Matplotlib figure on the Agg canvas
+		dpi: Output resolution
+
+	Returns:
+		HxWx4 uint8 RGBA array (a copy, independent of the figure)
+	"""
+	fig.set_dpi(dpi)
+	fig.canvas.draw()
+	renderer = fig.canvas.get_renderer()
+	tight_bbox = fig.get_tightbbox(renderer).padded(TIGHT_PAD_INCHES)
+	rgba = numpy.asarray(fig.canvas.buffer_rgba())
+	# Bbox is in inches from the bottom-left; image rows run top-down
+	height, width = rgba.shape[:2]
+	x0 = max(0, int(round(tight_bbox.x0 * dpi)))
+	x1 = min(width, x0 + int(round(tight_bbox.width * dpi)))
+	y0 = max(0, int(round(height - tight_bbox.y1 * dpi)))
+	y1 = min(height, y0 + int(round(tight_bbox.height * dpi)))
+	cropped = rgba[y0:y1, x0:x1].copy()
+	return cropped
+
+
+#============================================
+def _write_png(rgba: numpy.ndarray, output_path: str) -> None:
+	"""
+	Encode an RGBA array as PNG and write it to disk.
+
+	Args:
+		rgba: HxWx4 uint8 image
+		output_path: Path to save the PNG
+	"""
+	image = PIL.Image.fromarray(rgba)
+	# optimize=False (the default) skips Pillow's extra compression passes
+	image.save(
+		output_path, dpi=(DIAGNOSTIC_DPI, DIAGNOSTIC_DPI),
+		compress_level=PNG_COMPRESS_LEVEL, optimize=False,
+	)
+
+
+#============================================
+def _write_bgr_png(bgr: numpy.ndarray, output_path: str) -> None:
+	"""
+	Write a BGR image from the fast backend with cv2.
+
+	Args:
+		bgr: HxWx3 uint8 image
+		output_path: Path to save the PNG
+
+	Raises:
+		OSError: If cv2 could not write the file
+	"""
+	# cv2.imwrite reports a bad path or extension by returning False
+	if not cv2.imwrite(output_path, bgr):
+		raise OSError(f"Could not write diagnostic image: {output_path}")
+
+
+#============================================
+def _render_fast_panels(
+	glyph_image: numpy.ndarray,
+	binary_mask: numpy.ndarray,
+	contour_points: numpy.ndarray,
+	hull_vertices: numpy.ndarray,
+	ellipse_params: dict,
+	fit_quality: dict,
+	character: str,
+) -> numpy.ndarray:
+	"""
+	Draw the four diagnostic panels with cv2 and tile them in a 2x2 grid.
+
+	Same panel layout as the matplotlib figure, without axes or legends:
+	render, mask, contour (green) with hull (blue), and contour, hull,
+	ellipse and center (red), followed by the summary text.
+
+	Args:
+		glyph_image: Grayscale rendered image (cropped to glyph region)
+		binary_mask: Binary mask (cropped to glyph region)
+		contour_points: Nx2 contour coordinates (in cropped space)
+		hull_vertices: Mx2 hull vertices (in cropped space)
+		ellipse_params: Ellipse dict with center, semi_x, semi_y
+		fit_quality: Fit quality metrics dict
+		character: Character label ('O' or 'C')
+
+	Returns:
+		HxWx3 uint8 BGR image
+	"""
+	scale = FAST_PANEL_SCALE
+	height, width = glyph_image.shape[:2]
+	size = (width * scale, height * scale)
+	render = cv2.resize(glyph_image, size, interpolation=cv2.INTER_NEAREST)
+	mask = cv2.resize(binary_mask, size, interpolation=cv2.INTER_NEAREST)
+	# Faded render behind the overlays, like imshow(alpha=0.3) on white
+	faded = cv2.addWeighted(render, 0.3, render, 0.0, 255 * 0.7)
+
+	panel_render = cv2.cvtColor(render, cv2.COLOR_GRAY2BGR)
+	panel_mask = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
+	panel_hull = cv2.cvtColor(faded, cv2.COLOR_GRAY2BGR)
+	panel_fit = panel_hull.copy()
+
+	# Contour points as single dots on both overlay panels
+	contour_px = ((contour_points + 0.5) * scale).astype(numpy.int32)
+	contour_px[:, 0] = numpy.clip(contour_px[:, 0], 0, size[0] - 1)
+	contour_px[:, 1] = numpy.clip(contour_px[:, 1], 0, size[1] - 1)
+	panel_hull[contour_px[:, 1], contour_px[:, 0]] = FAST_CONTOUR_BGR
+	panel_fit[contour_px[:, 1], contour_px[:, 0]] = FAST_CONTOUR_BGR
+
+	if len(hull_vertices) > 0:
+		hull_fixed = [_to_fixed_point(numpy.asarray(hull_vertices, dtype=float))]
+		cv2.polylines(panel_hull, hull_fixed, True, FAST_HULL_BGR, 2,
+			cv2.LINE_AA, FAST_SHIFT_BITS)
+		cv2.polylines(panel_fit, hull_fixed, True, FAST_HULL_BGR, 1,
+			cv2.LINE_AA, FAST_SHIFT_BITS)
+
+	cx, cy = ellipse_params['center']
+	center_fixed = _to_fixed_point(numpy.array([cx, cy]))
+	# Semi-axes are lengths, so they take the scale but no pixel offset
+	fixed = scale * (1 << FAST_SHIFT_BITS)
+	axes_fixed = numpy.round(numpy.array([
+		ellipse_params['semi_x'], ellipse_params['semi_y'],
+	]) * fixed).astype(numpy.int32)
+	cv2.ellipse(panel_fit, tuple(center_fixed.tolist()),
+		tuple(axes_fixed.tolist()), 0, 0, 360, FAST_ELLIPSE_BGR, 2,
+		cv2.LINE_AA, FAST_SHIFT_BITS)
+	center_px = (int((cx + 0.5) * scale), int((cy + 0.5) * scale))
+	cv2.drawMarker(panel_fit, center_px, FAST_ELLIPSE_BGR,
+		cv2.MARKER_CROSS, 12 * scale, 2)
+
+	grid = numpy.vstack([
+		numpy.hstack([panel_render, panel_mask]),
+		numpy.hstack([panel_hull, panel_fit]),
+	])
+
+	# Title above and summary lines below the panel grid
+	font = cv2.FONT_HERSHEY_SIMPLEX
+	summary_lines = [
+		f"Character: {character}",
+		f"Center: ({cx:.1f}, {cy:.1f})  "
+		f"Semi-X: {ellipse_params['semi_x']:.1f}  "
+		f"Semi-Y: {ellipse_params['semi_y']:.1f}  "
+		f"Ecc: {ellipse_params['eccentricity']:.3f}",
+		f"Offset: {fit_quality['center_offset_pct']:.1f}%  "
+		f"Mean: {fit_quality['mean_boundary_pct']:.1f}%  "
+		f"Max: {fit_quality['max_boundary_pct']:.1f}%  "
+		f"Coverage: {fit_quality['coverage']:.1%}",
+	]
+	line_height = 22
+	text_band = numpy.full(
+		(line_height * len(summary_lines) + 8, grid.shape[1], 3), 255,
+		dtype=numpy.uint8
+	)
+	for line_idx, line in enumerate(summary_lines):
+		baseline = line_height * (line_idx + 1)
+		cv2.putText(text_band, line, (6, baseline), font, 0.5, (0, 0, 0),
+			1, cv2.LINE_AA)
+	bgr = numpy.vstack([grid, text_band])
+	return bgr
+
+
+#============================================
+def _to_fixed_point(points: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Map cropped-pixel coordinates to fixed-point upscaled panel coordinates.
+
+	The half-pixel offset puts pixel centers on the centers of the
+	upscaled blocks; cv2 drawing calls take the result with
+	shift=FAST_SHIFT_BITS.
+
+	Args:
+		points: Coordinates in cropped pixel space
+
+	Returns:
+		int32 array of the same shape
+	"""
+	fixed = FAST_PANEL_SCALE * (1 << FAST_SHIFT_BITS)
+	fixed_points = numpy.round((points + 0.5) * fixed).astype(numpy.int32)
+	return fixed_points
 
 
 #============================================
@@ -126,15 +474,11 @@ def _draw_ellipse_on_axis(ax, ellipse_params: dict, color: str, label: str) -> N
 		label: Legend label
 	"""
 	cx, cy = ellipse_params['center']
-	# matplotlib Ellipse takes full width/height, not semi-axes
-	width = 2.0 * ellipse_params['semi_x']
-	height = 2.0 * ellipse_params['semi_y']
-
-	ellipse = matplotlib.patches.Ellipse(
-		xy=(cx, cy), width=width, height=height,
-		angle=0, fill=False, edgecolor=color, linewidth=2, label=label
-	)
-	ax.add_patch(ellipse)
+	# A closed polyline from the precomputed unit circle; a plain Line2D
+	# skips the Patch path and transform machinery of patches.Ellipse
+	outline_x = cx + ellipse_params['semi_x'] * _UNIT_CIRCLE_COS
+	outline_y = cy + ellipse_params['semi_y'] * _UNIT_CIRCLE_SIN
+	ax.plot(outline_x, outline_y, color=color, linewidth=2, label=label)
 
 
 #============================================
@@ -142,6 +486,7 @@ def create_diagnostic_svg_overlay(
 	svg_input_path: str,
 	character_results: list,
 	output_path: str,
+	svg_bytes: bytes = None,
 ) -> None:
 	"""
 	Create diagnostic SVG with ellipse overlays on the original SVG.
@@ -149,23 +494,64 @@ def create_diagnostic_svg_overlay(
 	Overlays fitted ellipses and center markers at the SVG-space positions
 	computed by mapping pixel coordinates back through the viewBox transform.
 
+	The overlay group is spliced in front of the closing </svg> tag of the
+	original bytes, so the input is neither parsed nor re-serialized and
+	keeps its formatting. Files without a recognizable closing tag go
+	through ElementTree instead.
+
 	Args:
 		svg_input_path: Path to the original SVG file
 		character_results: List of result dicts from the pipeline
 		output_path: Path to save the diagnostic SVG
+		svg_bytes: Optional contents of svg_input_path already in memory;
+			the file is read when not given
+	"""
+	overlay_xml = _overlay_group_xml(character_results)
+	# Character references keep the splice valid in any ASCII-based encoding
+	overlay_bytes = overlay_xml.encode('ascii', 'xmlcharrefreplace')
+
+	data = svg_bytes
+	if data is None:
+		with open(svg_input_path, 'rb') as svg_file:
+			data = svg_file.read()
+
+	# The closing root tag is the last </svg> near the end, possibly
+	# namespace-prefixed; a nested <svg> may close just before it
+	tail_start = max(0, len(data) - 256)
+	close_match = None
+	for close_match in _SVG_CLOSE_PATTERN.finditer(data, tail_start):
+		pass
+	if close_match is None:
+		root = ET.fromstring(data)  # nosec B314 - local SVG files only
+		ET.register_namespace('', SVG_NS)
+		root.append(ET.fromstring(overlay_xml))  # nosec B314 - built here
+		tree = ET.ElementTree(root)
+		tree.write(output_path, encoding='utf-8', xml_declaration=True)
+		return
+
+	splice_at = close_match.start()
+	with open(output_path, 'wb') as out_file:
+		out_file.write(data[:splice_at])
+		out_file.write(overlay_bytes)
+		out_file.write(data[splice_at:])
+
+
+#============================================
+def _overlay_group_xml(character_results: list) -> str:
 	"""
-	tree = ET.parse(svg_input_path)  # nosec B314 - local SVG files only
-	root = tree.getroot()
+	Serialize the ellipse overlay group for create_diagnostic_svg_overlay().
 
-	ET.register_namespace('', SVG_NS)
+	The group declares the SVG namespace itself, so it is valid inside a
+	root that uses a default namespace or a prefix such as ns0:.
 
-	# Create overlay group
-	overlay = ET.SubElement(root, f'{{{SVG_NS}}}g')
-	overlay.set('id', 'ellipse-fit-overlay')
-	overlay.set('fill', 'none')
+	Args:
+		character_results: List of result dicts from the pipeline
 
-	# Color palette for different characters
-	colors = ['#ff3333', '#3366ff', '#33cc33', '#ff9900', '#cc33ff', '#00cccc']
+	Returns:
+		XML string for one <g> element holding every ellipse and center dot
+	"""
+	num_colors = len(OVERLAY_COLORS)
+	parts = [f'<g xmlns="{SVG_NS}" id="ellipse-fit-overlay" fill="none">']
 
 	for idx, result in enumerate(character_results):
 		if 'error' in result:
@@ -175,34 +561,22 @@ def create_diagnostic_svg_overlay(
 		if svg_ellipse is None:
 			continue
 
-		color = colors[idx % len(colors)]
-		char = result['char']
-		cx = svg_ellipse['cx']
-		cy = svg_ellipse['cy']
-		rx = svg_ellipse['rx']
-		ry = svg_ellipse['ry']
-
-		# Group for this character
-		grp = ET.SubElement(overlay, f'{{{SVG_NS}}}g')
-		grp.set('id', f'fit-{char}-{idx}')
-
-		# Ellipse outline
-		ell = ET.SubElement(grp, f'{{{SVG_NS}}}ellipse')
-		ell.set('cx', f'{cx:.4f}')
-		ell.set('cy', f'{cy:.4f}')
-		ell.set('rx', f'{rx:.4f}')
-		ell.set('ry', f'{ry:.4f}')
-		ell.set('stroke', color)
-		ell.set('stroke-width', '0.4')
-		ell.set('stroke-opacity', '0.85')
-		ell.set('fill', 'none')
-
-		# Center dot
-		dot = ET.SubElement(grp, f'{{{SVG_NS}}}circle')
-		dot.set('cx', f'{cx:.4f}')
-		dot.set('cy', f'{cy:.4f}')
-		dot.set('r', '0.8')
-		dot.set('fill', color)
-		dot.set('fill-opacity', '0.8')
-
-	tree.write(output_path, encoding='utf-8', xml_declaration=True)
+		color = OVERLAY_COLORS[idx % num_colors]
+		group_id = xml.sax.saxutils.quoteattr(f"fit-{result['char']}-{idx}")
+		cx_str = f"{svg_ellipse['cx']:.4f}"
+		cy_str = f"{svg_ellipse['cy']:.4f}"
+
+		# Group for this character: ellipse outline, then center dot
+		parts.append(
+			f'<g id={group_id}>'
+			f'<ellipse cx="{cx_str}" cy="{cy_str}" '
+			f'rx="{svg_ellipse["rx"]:.4f}" ry="{svg_ellipse["ry"]:.4f}" '
+			f'stroke="{color}" {_ELLIPSE_STROKE_ATTRS} />'
+			f'<circle cx="{cx_str}" cy="{cy_str}" r="0.8" '
+			f'fill="{color}" fill-opacity="0.8" />'
+			'</g>'
+		)
+
+	parts.append('</g>')
+	overlay_xml = ''.join(parts)
+	return overlay_xml
@@ -7,6 +7,8 @@ import sys
 import tempfile
 import shutil
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -50,6 +52,58 @@ def test_parse_args_custom():
 	assert args.verbose is True
 
 
+def test_parse_args_jobs():
+	"""Test the worker process count flag."""
+	sys.argv = ['find_letter_centers.py', '-j', '4']
+	args = find_letter_centers.parse_args()
+	assert args.jobs == 4
+
+	sys.argv = ['find_letter_centers.py']
+	args = find_letter_centers.parse_args()
+	assert args.jobs == 1
+
+
+def test_parse_args_diagnostics():
+	"""Test the diagnostic image on/off flags."""
+	sys.argv = ['find_letter_centers.py']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostics is True
+
+	sys.argv = ['find_letter_centers.py', '-D']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostics is False
+
+	sys.argv = ['find_letter_centers.py', '--no-diagnostics', '--diagnostics']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostics is True
+
+
+def test_parse_args_diagnostic_backend():
+	"""Test the diagnostic backend choice."""
+	sys.argv = ['find_letter_centers.py']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostic_backend == 'matplotlib'
+
+	sys.argv = ['find_letter_centers.py', '-b', 'fast']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostic_backend == 'fast'
+
+
+def test_parse_args_diagnostic_every():
+	"""Test the diagnostic PNG sampling stride."""
+	sys.argv = ['find_letter_centers.py']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostic_every == 1
+
+	sys.argv = ['find_letter_centers.py', '-e', '5']
+	args = find_letter_centers.parse_args()
+	assert args.diagnostic_every == 5
+
+	sys.argv = ['find_letter_centers.py', '-e', '0']
+	with pytest.raises(SystemExit):
+		find_letter_centers.parse_args()
+
+
 def test_main_nonexistent_input():
 	"""Test main with nonexistent input path."""
 	temp_output = tempfile.mkdtemp()
@@ -164,3 +164,48 @@ def test_fit_quality_degenerate_ellipse():
 	assert quality['rmse'] == float('inf')
 	assert quality['max_error'] == float('inf')
 	assert quality['coverage'] == 0.0
+
+
+def test_points_to_ellipse_distances_matches_scalar():
+	"""Test vectorized boundary distances against the scalar helper."""
+	points = numpy.array([
+		[50.0, 50.0], [62.0, 50.0], [50.0, 75.0], [41.0, 33.0], [70.0, 70.0],
+	])
+	cx, cy, semi_x, semi_y = 50.0, 50.0, 10.0, 20.0
+
+	distances = geometry._points_to_ellipse_distances(points, cx, cy, semi_x, semi_y)
+	expected = [
+		geometry._point_to_ellipse_distance(p[0], p[1], cx, cy, semi_x, semi_y)
+		for p in points
+	]
+
+	assert numpy.allclose(distances, expected)
+	# Point at the center is one minor semi-axis from the boundary
+	assert distances[0] == 10.0
+
+
+def test_fit_axis_aligned_ellipse_far_from_origin():
+	"""Test ellipse fit on pixel coordinates far from the origin."""
+	t = numpy.linspace(0, 2 * numpy.pi, 400, endpoint=False)
+	center_x, center_y = 2500.0, 1800.0
+	points = numpy.column_stack([
+		center_x + 35.0 * numpy.cos(t),
+		center_y + 48.0 * numpy.sin(t)
+	])
+
+	ellipse = geometry.fit_axis_aligned_ellipse(points)
+
+	assert abs(ellipse['center'][0] - center_x) < 1e-6
+	assert abs(ellipse['center'][1] - center_y) < 1e-6
+	assert abs(ellipse['semi_x'] - 35.0) < 1e-6
+	assert abs(ellipse['semi_y'] - 48.0) < 1e-6
+
+
+def test_polygon_area_perimeter_rectangle():
+	"""Test shoelace area and perimeter on a rectangle."""
+	vertices = numpy.array([[0, 0], [4, 0], [4, 3], [0, 3]])
+
+	area, perimeter = geometry._polygon_area_perimeter(vertices)
+
+	assert area == 12.0
+	assert perimeter == 14.0
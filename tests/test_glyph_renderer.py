@@ -2,6 +2,7 @@
 Unit tests for glyph_renderer module.
 """
 
+import cv2
 import numpy
 import pytest
 from letter_center_finder import glyph_renderer
@@ -54,6 +55,38 @@ def test_extract_binary_mask():
 	assert numpy.sum(binary == 255) > 0
 
 
+def test_extract_binary_mask_roi_matches_full_closing():
+	"""Test that closing inside the glyph box matches full-canvas closing."""
+	image = numpy.full((60, 60), 255, dtype=numpy.uint8)
+	image[10:40, 0:30] = 0
+	# One-pixel gaps that closing should fill
+	image[20, 5:25] = 255
+	image[10:40, 15] = 255
+	_, expected = cv2.threshold(
+		image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
+	)
+	expected = cv2.morphologyEx(expected, cv2.MORPH_CLOSE, numpy.ones((3, 3), numpy.uint8))
+
+	binary = glyph_renderer.extract_binary_mask(image)
+
+	assert numpy.array_equal(binary, expected)
+
+
+def test_close_mask_gaps_on_crop_matches_full_mask():
+	"""Test that closing a padded crop matches closing the whole mask."""
+	image = numpy.full((80, 80), 255, dtype=numpy.uint8)
+	image[30:50, 30:50] = 0
+	image[40, 32:48] = 255
+	full = glyph_renderer.extract_binary_mask(image)
+	raw = glyph_renderer.extract_binary_mask(image, close_gaps=False)
+
+	# Raw mask keeps the one-pixel gap
+	assert raw[40, 40] == 0
+	crop = glyph_renderer.close_mask_gaps(raw[20:60, 20:60])
+
+	assert numpy.array_equal(crop, full[20:60, 20:60])
+
+
 def test_extract_contour_points():
 	"""Test extracting contour points from binary mask."""
 	glyph = glyph_renderer.render_single_glyph('O', 12.0)
@@ -92,3 +125,35 @@ def test_crop_to_content():
 	# Allow for off-by-one due to pixel boundaries
 	assert cropped.shape[0] >= 20 + 2 * 5 - 1  # square size + padding
 	assert cropped.shape[1] >= 20 + 2 * 5 - 1
+
+
+def test_build_isolation_svg_from_context(tmp_path):
+	"""Test that the isolation SVG keeps only the target character colored."""
+	svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">
+	<path d="M0 0 L10 10" stroke="#000"/>
+	<text x="10" y="20" font-size="12" fill="#000000">HN</text>
+	<text x="30" y="20" font-size="12" fill="#8b0000">HOC</text>
+</svg>'''
+	svg_path = tmp_path / 'sample.svg'
+	svg_path.write_text(svg_content)
+
+	svg_context = glyph_renderer.load_svg_context(str(svg_path))
+	assert len(svg_context['text_elements']) == 2
+
+	char_meta = {
+		'_text_elem_index': 1,
+		'_tspan_index': None,
+		'_char_offset': 1,
+		'fill_color': '#8b0000',
+	}
+	isolation_svg = glyph_renderer._build_isolation_svg(svg_context, char_meta)
+
+	# Paths and other text elements are dropped
+	assert '<path' not in isolation_svg
+	assert 'HN' not in isolation_svg
+	# Only the target O keeps the original fill
+	assert 'fill="#8b0000">O</tspan>' in isolation_svg
+	assert isolation_svg.count('#8b0000') == 1
+	# Building must not modify the shared parsed tree
+	assert svg_context['text_elements'][1].text == 'HOC'
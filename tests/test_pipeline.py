@@ -4,8 +4,10 @@ Unit tests for pipeline module.
 
 import os
 import json
+import concurrent.futures
 import tempfile
 import shutil
+import numpy
 import pytest
 from letter_center_finder import pipeline
 
@@ -116,6 +118,39 @@ def test_process_svg_file_filter_letters(sample_svg_file, temp_output_dir):
 	assert result['characters'][0]['char'] == 'O'
 
 
+def _fail_setup(*args, **kwargs):
+	"""Stand-in for per-glyph setup that must not run."""
+	raise AssertionError('per-glyph setup ran for a file with no targets')
+
+
+def test_process_svg_file_no_targets_skips_setup(sample_svg_file, temp_output_dir, monkeypatch):
+	"""Test that a file with no target letters never builds the figure or pools."""
+	monkeypatch.setattr(pipeline.visualizer, 'create_diagnostic_figure', _fail_setup)
+	monkeypatch.setattr(pipeline.concurrent.futures, 'ThreadPoolExecutor', _fail_setup)
+
+	result = pipeline.process_svg_file(sample_svg_file, temp_output_dir, target_letters='X')
+	assert result['characters'] == []
+
+
+def test_process_svg_file_byte_prefilter(temp_output_dir, monkeypatch):
+	"""Test that a file with no O or C bytes is never parsed into a tree."""
+	svg_path = os.path.join(temp_output_dir, 'labels.svg')
+	with open(svg_path, 'w') as f:
+		f.write('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+			'<text x="1" y="5">HN</text></svg>')
+	monkeypatch.setattr(pipeline.glyph_renderer, 'load_svg_context', _fail_setup)
+
+	result = pipeline.process_svg_file(svg_path, temp_output_dir)
+	assert result['characters'] == []
+	assert os.path.exists(os.path.join(temp_output_dir, 'labels', 'results.json'))
+
+def test_diagnostic_every_must_be_positive(sample_svg_file, temp_output_dir):
+	"""Test that a diagnostic stride below 1 is rejected up front."""
+	with pytest.raises(ValueError):
+		pipeline.process_svg_file(sample_svg_file, temp_output_dir, diagnostic_every=0)
+	with pytest.raises(ValueError):
+		pipeline.batch_process(temp_output_dir, temp_output_dir, diagnostic_every=0)
+
 def test_batch_process(temp_output_dir):
 	"""Test batch processing of directory."""
 	# Create temporary directory with multiple SVG files
@@ -169,3 +204,72 @@ def test_batch_process_empty_directory(temp_output_dir):
 
 	finally:
 		shutil.rmtree(temp_input_dir)
+
+
+def test_batch_process_parallel_matches_serial(temp_output_dir):
+	"""Test that a process pool gives the same stats as the serial loop."""
+	temp_input_dir = tempfile.mkdtemp()
+
+	try:
+		# SVGs without target letters exercise the pipeline without rendering
+		for i in range(3):
+			svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
+	<text x="10" y="20" font-family="sans-serif" font-size="12">HN</text>
+</svg>'''
+			with open(os.path.join(temp_input_dir, f'test_{i}.svg'), 'w') as f:
+				f.write(svg_content)
+
+		serial_dir = os.path.join(temp_output_dir, 'serial')
+		parallel_dir = os.path.join(temp_output_dir, 'parallel')
+		serial = pipeline.batch_process(temp_input_dir, serial_dir, jobs=1)
+		parallel = pipeline.batch_process(temp_input_dir, parallel_dir, jobs=2)
+
+		assert serial == parallel
+		assert parallel['files_processed'] == 3
+
+		# jobs=0 picks one worker per CPU core
+		auto_dir = os.path.join(temp_output_dir, 'auto')
+		auto = pipeline.batch_process(temp_input_dir, auto_dir, jobs=0)
+		assert auto == serial
+
+		# Report lists files in the same sorted order
+		with open(os.path.join(serial_dir, 'summary_report.txt')) as f:
+			serial_report = f.read()
+		with open(os.path.join(parallel_dir, 'summary_report.txt')) as f:
+			parallel_report = f.read()
+		assert serial_report == parallel_report
+
+	finally:
+		shutil.rmtree(temp_input_dir)
+
+
+def test_crop_to_glyph_bounds():
+	"""Test that the crop keeps the glyph box plus clamped padding."""
+	image = numpy.full((50, 60), 255, dtype=numpy.uint8)
+	mask = numpy.zeros((50, 60), dtype=numpy.uint8)
+	mask[10:20, 30:45] = 255
+	image[10:20, 30:45] = 0
+
+	cropped_image, cropped_mask, offset = pipeline._crop_to_glyph(image, mask, padding=5)
+
+	assert offset == (25, 5)
+	assert cropped_mask.shape == (20, 25)
+	assert cropped_image.shape == cropped_mask.shape
+	assert cropped_mask.sum() == mask.sum()
+
+	# Empty mask returns the inputs unchanged
+	empty = numpy.zeros((50, 60), dtype=numpy.uint8)
+	_, same_mask, offset = pipeline._crop_to_glyph(image, empty, padding=5)
+	assert offset == (0, 0)
+	assert same_mask is empty
+
+
+def test_limit_pending_writes_waits_on_oldest():
+	"""Test that the write queue is trimmed from the oldest future."""
+	with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+		futures = [executor.submit(int, str(i)) for i in range(5)]
+		write_pool = {'executor': executor, 'futures': list(futures)}
+		pipeline._limit_pending_writes(write_pool, 2)
+		assert write_pool['futures'] == futures[3:]
+		assert all(f.done() for f in futures[:3])
@@ -4,6 +4,8 @@ Unit tests for svg_parser module.
 
 import os
 import tempfile
+import xml.etree.ElementTree as ET
+
 from letter_center_finder import svg_parser
 
 
@@ -15,23 +17,16 @@ def test_parse_simple_svg():
 	<text x="30" y="20" font-family="sans-serif" font-size="12" fill="#000">C</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 2
-		assert chars[0]['character'] == 'O'
-		assert chars[1]['character'] == 'C'
-		# x is now cursor position (left edge of char), should equal the text x for single chars
-		assert chars[0]['x'] == 10.0
-		assert chars[1]['x'] == 30.0
-		# cx/cy should be present and centered
-		assert 'cx' in chars[0]
-		assert 'cy' in chars[0]
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 2
+	assert chars[0]['character'] == 'O'
+	assert chars[1]['character'] == 'C'
+	# x is now cursor position (left edge of char), should equal the text x for single chars
+	assert chars[0]['x'] == 10.0
+	assert chars[1]['x'] == 30.0
+	# cx/cy should be present and centered
+	assert 'cx' in chars[0]
+	assert 'cy' in chars[0]
 
 
 def test_parse_tspan_svg():
@@ -45,16 +40,9 @@ def test_parse_tspan_svg():
 	</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		assert chars[0]['character'] == 'O'
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	assert chars[0]['character'] == 'O'
 
 
 def test_parse_composite_text():
@@ -64,22 +52,15 @@ def test_parse_composite_text():
 	<text x="10" y="20" font-family="sans-serif" font-size="12">HOH2C</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		# Should find 1 O and 1 C in "HOH2C"
-		assert len(chars) == 2
-		o_chars = [c for c in chars if c['character'] == 'O']
-		c_chars = [c for c in chars if c['character'] == 'C']
-		assert len(o_chars) == 1
-		assert len(c_chars) == 1
-		# O is at index 1, C is at index 4 - O should be left of C
-		assert o_chars[0]['cx'] < c_chars[0]['cx']
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	# Should find 1 O and 1 C in "HOH2C"
+	assert len(chars) == 2
+	o_chars = [c for c in chars if c['character'] == 'O']
+	c_chars = [c for c in chars if c['character'] == 'C']
+	assert len(o_chars) == 1
+	assert len(c_chars) == 1
+	# O is at index 1, C is at index 4 - O should be left of C
+	assert o_chars[0]['cx'] < c_chars[0]['cx']
 
 
 def test_font_attribute_inheritance():
@@ -91,18 +72,11 @@ def test_font_attribute_inheritance():
 	</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		assert chars[0]['font_family'] == 'Arial'
-		assert chars[0]['font_size'] == 14.0
-		assert chars[0]['font_weight'] == 'bold'
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	assert chars[0]['font_family'] == 'Arial'
+	assert chars[0]['font_size'] == 14.0
+	assert chars[0]['font_weight'] == 'bold'
 
 
 def test_parse_style_attribute():
@@ -113,6 +87,9 @@ def test_parse_style_attribute():
 	assert result['font-family'] == 'Arial'
 	assert result['font-size'] == '12px'
 	assert result['fill'] == '#000000'
+	# Callers get their own dict; editing it leaves the cached parse alone
+	result['fill'] = '#ffffff'
+	assert svg_parser.parse_style_attribute(style)['fill'] == '#000000'
 
 
 def test_no_target_characters():
@@ -122,17 +99,10 @@ def test_no_target_characters():
 	<text x="10" y="20" font-family="sans-serif" font-size="12">HELLO</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		# Should find 1 O (in "HELLO")
-		assert len(chars) == 1
-		assert chars[0]['character'] == 'O'
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	# Should find 1 O (in "HELLO")
+	assert len(chars) == 1
+	assert chars[0]['character'] == 'O'
 
 
 # === Font metric function tests ===
@@ -217,20 +187,13 @@ def test_text_anchor_start():
 	<text x="50" y="40" font-size="12" text-anchor="start">O</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		# For start anchor, cursor starts at x=50
-		# cx should be x + advance/2
-		advance = svg_parser._glyph_char_advance(12.0, 'O')
-		expected_cx = 50.0 + advance * 0.5
-		assert abs(chars[0]['cx'] - expected_cx) < 1e-9
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	# For start anchor, cursor starts at x=50
+	# cx should be x + advance/2
+	advance = svg_parser._glyph_char_advance(12.0, 'O')
+	expected_cx = 50.0 + advance * 0.5
+	assert abs(chars[0]['cx'] - expected_cx) < 1e-9
 
 
 def test_text_anchor_end():
@@ -240,23 +203,16 @@ def test_text_anchor_end():
 	<text x="100" y="40" font-size="12" text-anchor="end">HO</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		assert chars[0]['character'] == 'O'
-		# For end anchor, cursor starts at x - text_width
-		# O center should be left of x=100
-		assert chars[0]['cx'] < 100.0
-		# Verify the O center is within the text span
-		text_width = svg_parser._glyph_text_width('HO', 12.0)
-		left_edge = 100.0 - text_width
-		assert chars[0]['cx'] > left_edge
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	assert chars[0]['character'] == 'O'
+	# For end anchor, cursor starts at x - text_width
+	# O center should be left of x=100
+	assert chars[0]['cx'] < 100.0
+	# Verify the O center is within the text span
+	text_width = svg_parser._glyph_text_width('HO', 12.0)
+	left_edge = 100.0 - text_width
+	assert chars[0]['cx'] > left_edge
 
 
 def test_text_anchor_middle():
@@ -266,18 +222,11 @@ def test_text_anchor_middle():
 	<text x="100" y="40" font-size="12" text-anchor="middle">O</text>
 </svg>'''
 
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
-		f.write(svg_content)
-		temp_path = f.name
-
-	try:
-		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		# For single char with middle anchor, cx should be very close to x
-		# (text_width/2 shifts left, then advance/2 shifts right - these are the same for single char)
-		assert abs(chars[0]['cx'] - 100.0) < 1e-9
-	finally:
-		os.unlink(temp_path)
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	# For single char with middle anchor, cx should be very close to x
+	# (text_width/2 shifts left, then advance/2 shifts right - these are the same for single char)
+	assert abs(chars[0]['cx'] - 100.0) < 1e-9
 
 
 def test_text_anchor_end_ho_o_is_left_of_x():
@@ -411,15 +360,139 @@ def test_text_anchor_from_style_attribute():
 	<text x="100" y="40" font-size="12" style="text-anchor:end">HO</text>
 </svg>'''
 
+	chars = svg_parser.parse_svg_string(svg_content)
+	assert len(chars) == 1
+	assert chars[0]['character'] == 'O'
+	# With end anchor at x=100, O center should be left of 100
+	assert chars[0]['cx'] < 100.0
+
+
+def test_parse_svg_root_matches_separate_parses():
+	"""Test that the single-parse API matches the two separate calls."""
+	svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="200px" height="100" viewBox="0 0 400 200">
+	<text x="10" y="20" font-family="sans-serif" font-size="12">HO</text>
+	<text x="50" y="60" font-size="14"><tspan>C</tspan><tspan x="80">N</tspan></text>
+</svg>'''
+
+	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
+		f.write(svg_content)
+		temp_path = f.name
+
+	try:
+		root = ET.parse(temp_path).getroot()
+		svg_dims, chars = svg_parser.parse_svg_root(root)
+		assert svg_dims == svg_parser.get_svg_dimensions(temp_path)
+		assert chars == svg_parser.parse_svg_file(temp_path)
+		assert chars == svg_parser.parse_svg_string(svg_content)
+		assert [c['character'] for c in chars] == ['O', 'C']
+	finally:
+		os.unlink(temp_path)
+
+
+def test_get_render_scale_meet():
+	"""Test that the render scale uses the smaller viewport/viewBox ratio."""
+	svg_dims = {
+		'viewBox': {'x': 0.0, 'y': 0.0, 'width': 400.0, 'height': 100.0},
+		'viewport_width': 200.0,
+		'viewport_height': 100.0,
+	}
+	assert svg_parser.get_render_scale(svg_dims) == 0.5
+	assert svg_parser.get_render_scale(svg_dims, zoom=10) == 5.0
+
+
+def test_pixel_transform_round_trip():
+	"""Test svg_to_pixel and pixel_to_svg with an offset, letterboxed viewBox."""
+	svg_dims = {
+		'viewBox': {'x': -10.0, 'y': 5.0, 'width': 400.0, 'height': 100.0},
+		'viewport_width': 200.0,
+		'viewport_height': 100.0,
+	}
+	# meet scale is 0.5 per unit at zoom 1, so 5 at zoom 10; the 1000x1000
+	# viewport centers the 2000x500 px drawing vertically
+	px, py = svg_parser.svg_to_pixel(-10.0, 5.0, svg_dims, zoom=10)
+	assert abs(px - 0.0) < 1e-9
+	assert abs(py - 250.0) < 1e-9
+
+	for sx, sy in [(0.0, 0.0), (12.5, 40.0), (390.0, 105.0)]:
+		px, py = svg_parser.svg_to_pixel(sx, sy, svg_dims, zoom=10)
+		bx, by = svg_parser.pixel_to_svg(px, py, svg_dims, zoom=10)
+		assert abs(bx - sx) < 1e-9
+		assert abs(by - sy) < 1e-9
+
+
+def test_parse_svg_file_byte_prefilter():
+	"""Test the no-target byte scan and the character reference escape."""
+	ns = 'http://www.w3.org/2000/svg'
+	no_targets = f'<svg xmlns="{ns}" width="10" height="10"><text>HN</text></svg>'
+	char_ref = f'<svg xmlns="{ns}" width="10" height="10"><text>H&#79;</text></svg>'
+
+	paths = []
+	for content in (no_targets, char_ref):
+		with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
+			f.write(content)
+			paths.append(f.name)
+
+	try:
+		assert svg_parser.may_contain_targets(no_targets) is False
+		assert svg_parser.may_contain_targets(no_targets.encode('ascii')) is False
+		assert svg_parser.parse_svg_file(paths[0]) == []
+		chars = svg_parser.parse_svg_file(paths[1])
+		assert [c['character'] for c in chars] == ['O']
+		assert svg_parser.parse_svg_string(char_ref) == chars
+	finally:
+		for path in paths:
+			os.unlink(path)
+
+
+def test_parse_svg_file_nested_groups():
+	"""Test that text inside groups keeps its document-order index."""
+	svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
+	<g><path d="M0 0L10 10"/><text x="10" y="20" font-size="12">O</text></g>
+	<path d="M5 5L20 20"/>
+	<g><g><text x="30" y="20" font-size="12"><tspan>H</tspan><tspan>C</tspan></text></g></g>
+</svg>'''
+
 	with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False) as f:
 		f.write(svg_content)
 		temp_path = f.name
 
 	try:
 		chars = svg_parser.parse_svg_file(temp_path)
-		assert len(chars) == 1
-		assert chars[0]['character'] == 'O'
-		# With end anchor at x=100, O center should be left of 100
-		assert chars[0]['cx'] < 100.0
+		assert chars == svg_parser.parse_svg_string(svg_content)
+		assert [c['character'] for c in chars] == ['O', 'C']
+		assert [c['_text_elem_index'] for c in chars] == [0, 1]
+		assert chars[1]['_tspan_index'] == 1
 	finally:
 		os.unlink(temp_path)
+
+
+def test_extract_characters_from_text_element_old_signature():
+	"""Test that the public helper still takes a positional ns dict."""
+	ns = {'svg': 'http://www.w3.org/2000/svg'}
+	root = ET.fromstring(
+		'<svg xmlns="http://www.w3.org/2000/svg">'
+		'<text x="10" y="20" font-size="12">HO</text></svg>'
+	)
+	text_elem = root[0]
+	chars = svg_parser.extract_characters_from_text_element(text_elem, ns, 3)
+	assert [c['character'] for c in chars] == ['O']
+	assert chars[0]['_text_elem_index'] == 3
+
+
+def test_parse_svg_string_keeps_text_tail():
+	"""Test that source_text includes the element tail, as parse_svg_root does."""
+	svg_content = (
+		'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+		'<text x="10" y="20" font-size="12">HO</text>tail words'
+		'<g><text x="30" y="20" font-size="12"><tspan>C</tspan>N</text>more</g>'
+		'</svg>'
+	)
+	root = ET.fromstring(svg_content)
+	expected = svg_parser.parse_svg_root(root)[1]
+
+	assert svg_parser.parse_svg_string(svg_content) == expected
+	assert svg_parser.parse_svg_string(svg_content.encode('utf-8')) == expected
+	assert expected[0]['source_text'] == 'HOtail words'
+	assert expected[1]['source_text'] == 'CNmore'
@@ -0,0 +1,153 @@
+"""
+Unit tests for visualizer module.
+"""
+
+import concurrent.futures
+import xml.etree.ElementTree as ET
+
+import cv2
+import numpy
+import pytest
+import PIL.Image
+from letter_center_finder import geometry
+from letter_center_finder import visualizer
+
+
+def _synthetic_glyph():
+	"""Build a ring glyph with its contour, hull, ellipse, and fit quality."""
+	image = numpy.full((120, 100), 255, dtype=numpy.uint8)
+	cv2.ellipse(image, (50, 60), (35, 45), 0, 0, 360, 0, 8)
+	_, mask = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV)
+	contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+	points = contours[0].reshape(-1, 2)
+	hull = geometry.compute_convex_hull(points)
+	ellipse = geometry.fit_axis_aligned_ellipse(points)
+	quality = geometry.compute_fit_quality(points, ellipse)
+	return image, mask, points, hull['vertices'], ellipse, quality
+
+
+def test_create_diagnostic_plot_background_write(tmp_path):
+	"""Test that a background PNG write matches the inline write."""
+	glyph = _synthetic_glyph()
+	inline_path = str(tmp_path / 'inline.png')
+	background_path = str(tmp_path / 'background.png')
+
+	result = visualizer.create_diagnostic_plot(*glyph, inline_path, 'O')
+	assert result is None
+
+	with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+		future = visualizer.create_diagnostic_plot(
+			*glyph, background_path, 'O', executor
+		)
+		future.result()
+
+	inline_pixels = numpy.asarray(PIL.Image.open(inline_path))
+	background_pixels = numpy.asarray(PIL.Image.open(background_path))
+	assert inline_pixels.shape[2] == 4
+	assert numpy.array_equal(inline_pixels, background_pixels)
+
+
+def test_create_diagnostic_plot_reused_figure(tmp_path):
+	"""Test that drawing on a reused figure matches a fresh figure."""
+	glyph = _synthetic_glyph()
+	fresh_path = str(tmp_path / 'fresh.png')
+	reused_path = str(tmp_path / 'reused.png')
+
+	visualizer.create_diagnostic_plot(*glyph, fresh_path, 'O')
+	figure = visualizer.create_diagnostic_figure()
+	# Draw a different glyph first so the reuse has something to clear
+	visualizer.create_diagnostic_plot(
+		*glyph, str(tmp_path / 'first.png'), 'C', figure=figure
+	)
+	visualizer.create_diagnostic_plot(*glyph, reused_path, 'O', figure=figure)
+	visualizer.close_diagnostic_figure(figure)
+
+	fresh_pixels = numpy.asarray(PIL.Image.open(fresh_path))
+	reused_pixels = numpy.asarray(PIL.Image.open(reused_path))
+	assert numpy.array_equal(fresh_pixels, reused_pixels)
+
+
+def test_create_diagnostic_plot_fast_backend(tmp_path):
+	"""Test that the fast backend tiles four upscaled panels plus text."""
+	glyph = _synthetic_glyph()
+	output_path = str(tmp_path / 'fast.png')
+
+	result = visualizer.create_diagnostic_plot(
+		*glyph, output_path, 'O', backend='fast'
+	)
+	assert result is None
+
+	image = cv2.imread(output_path)
+	height, width = glyph[0].shape
+	scale = visualizer.FAST_PANEL_SCALE
+	assert image.shape[1] == 2 * width * scale
+	assert image.shape[0] > 2 * height * scale
+	# Fitted ellipse drawn in red on the last panel
+	fit_panel = image[height * scale:2 * height * scale, width * scale:]
+	red = (fit_panel[:, :, 2] > 200) & (fit_panel[:, :, 1] < 80)
+	assert red.sum() > 0
+
+
+def test_create_diagnostic_plot_fast_backend_write_error(tmp_path):
+	"""Test that a failed cv2 write raises inline and through the executor."""
+	glyph = _synthetic_glyph()
+	output_path = str(tmp_path / 'missing_dir' / 'fast.png')
+
+	with pytest.raises(OSError):
+		visualizer.create_diagnostic_plot(*glyph, output_path, 'O', backend='fast')
+	with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+		write_future = visualizer.create_diagnostic_plot(
+			*glyph, output_path, 'O', executor, backend='fast'
+		)
+		with pytest.raises(OSError):
+			write_future.result()
+
+
+def test_create_diagnostic_svg_overlay_namespaces(tmp_path):
+	"""Test the overlay splice for default-namespace and prefixed roots."""
+	results = [
+		{'char': 'O', 'svg_ellipse': {'cx': 1.0, 'cy': 2.0, 'rx': 3.0, 'ry': 4.0}},
+		{'char': 'C', 'index': 0, 'error': 'Too few glyph pixels'},
+		{'char': 'C', 'svg_ellipse': {'cx': 5.0, 'cy': 6.0, 'rx': 2.0, 'ry': 2.5}},
+	]
+	ns = visualizer.SVG_NS
+	sources = {
+		'default': f'<svg xmlns="{ns}"><text>O</text></svg>\n',
+		'prefixed': f'<ns0:svg xmlns:ns0="{ns}"><ns0:text>C</ns0:text></ns0:svg>',
+		# Closing tag too far from the end for the splice; ElementTree path
+		'padded': f'<svg xmlns="{ns}"><text>O</text></svg><!-- {"x" * 300} -->',
+	}
+	for name, source in sources.items():
+		input_path = tmp_path / f'{name}.svg'
+		input_path.write_text(source)
+		output_path = str(tmp_path / f'{name}_diagnostic.svg')
+		visualizer.create_diagnostic_svg_overlay(str(input_path), results, output_path)
+
+		root = ET.parse(output_path).getroot()
+		ellipses = list(root.iter(f'{{{ns}}}ellipse'))
+		assert [e.get('cx') for e in ellipses] == ['1.0000', '5.0000']
+		assert len(list(root.iter(f'{{{ns}}}circle'))) == 2
+		assert len(list(root.iter(f'{{{ns}}}text'))) == 1
+
+
+def test_create_diagnostic_svg_overlay_nested_svg(tmp_path):
+	"""Test that the overlay goes in the root, not a nested <svg> at the end."""
+	results = [
+		{'char': 'O', 'svg_ellipse': {'cx': 1.0, 'cy': 2.0, 'rx': 3.0, 'ry': 4.0}},
+	]
+	ns = visualizer.SVG_NS
+	source = (
+		f'<svg xmlns="{ns}" viewBox="0 0 100 100"><text>O</text>'
+		'<svg x="50" viewBox="0 0 10 10"><rect width="1" height="1"/></svg>\n'
+		'</svg>\n'
+	)
+	input_path = tmp_path / 'nested.svg'
+	input_path.write_text(source)
+	output_path = str(tmp_path / 'nested_diagnostic.svg')
+	visualizer.create_diagnostic_svg_overlay(str(input_path), results, output_path)
+
+	root = ET.parse(output_path).getroot()
+	overlay = root[-1]
+	assert overlay.get('id') == 'ellipse-fit-overlay'
+	nested = root.find(f'{{{ns}}}svg')
+	assert nested.find(f'{{{ns}}}g') is None